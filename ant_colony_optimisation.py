@@ -1,4 +1,10 @@
-import math, random
+import math
+
+import numpy as np
+
+from bio_inspired.checkpoint import load_checkpoint, make_checkpointer, rng_state, set_rng_state
+from bio_inspired.instrumentation import make_timer
+from bio_inspired.rng import python_random
 
 # ---------- Distance Matrix ----------
 def compute_distance_matrix(cities):
@@ -11,57 +17,114 @@ def compute_distance_matrix(cities):
     return dist
 
 # ---------- Ant Colony Optimization ----------
-def ACO_TSP(cities, n_ants=10, n_iterations=50, alpha=1, beta=2, rho=0.5, Q=100):
+def ACO_TSP(cities, n_ants=10, n_iterations=50, alpha=1, beta=2, rho=0.5, Q=100, observer=None,
+            checkpoint=None, resume_from=None, seed=None, backend=None, two_opt=False, dist=None,
+            neighbors=None, neighbor_dist=None):
+    # checkpoint / resume_from: see bio_inspired.checkpoint. A resumed run needs
+    # the same arguments and continues exactly where the checkpoint was taken.
+    # seed: int, SeedSequence, Generator or random.Random (see bio_inspired.rng)
+    # backend: "numba", "numpy", "python" or "auto" runs the array version in
+    # bio_inspired.kernels (optionally with 2-opt); None keeps this implementation.
+    # dist: optional precomputed (n, n) distance matrix, e.g. the memory-mapped
+    # table of a bio_inspired.tsp_io instance (read row by row, never copied);
+    # cities are then only counted.
+    # neighbors / neighbor_dist: candidate lists (e.g. instance.neighbors) for
+    # the kernel backends, see bio_inspired.kernels.aco_tsp.
+    if backend is not None:
+        if checkpoint is not None or resume_from is not None:
+            raise ValueError("checkpoint/resume_from need backend=None")
+        from bio_inspired.kernels import aco_tsp
+        return aco_tsp(cities, n_ants, n_iterations, alpha, beta, rho, Q, two_opt=two_opt,
+                       backend=backend, seed=seed, observer=observer, dist=dist,
+                       neighbors=neighbors, neighbor_dist=neighbor_dist)
+    if two_opt or neighbors is not None:
+        raise ValueError("two_opt and neighbors need a kernel backend (e.g. backend='auto')")
+    rng = python_random(seed)
+    timer = make_timer(observer, "aco")
+    checkpointer = make_checkpointer(checkpoint)
     n = len(cities)
-    dist = compute_distance_matrix(cities)
+    if dist is None:
+        dist = compute_distance_matrix(cities)
+    if isinstance(dist, list):
+        row = dist.__getitem__
+    else:
+        # One row at a time as a list: list indexing is much faster than array
+        # indexing in the loop below, and a memmap is never copied whole
+        row = lambda i: dist[i].tolist()
 
-    # initialize pheromone trails
-    pheromone = [[1 for _ in range(n)] for _ in range(n)]
-    best_route, best_length = None, float("inf")
+    if resume_from is None:
+        # initialize pheromone trails
+        pheromone = [[1 for _ in range(n)] for _ in range(n)]
+        best_route, best_length = None, float("inf")
+        start = 0
+    else:
+        state = load_checkpoint(resume_from, "aco")
+        pheromone = state["pheromone"].tolist()
+        best_route, best_length = state["best_route"].tolist(), state["best_length"]
+        start = state["iteration"]
+        set_rng_state(rng, state["rng"])
 
-    for _ in range(n_iterations):
+    for iteration in range(start, n_iterations):
+        timer.iteration_start(iteration)
         all_routes = []
-        for _ in range(n_ants):
-            route = [random.randint(0, n-1)]
-            while len(route) < n:
-                i = route[-1]
-                probs = []
-                for j in range(n):
-                    if j not in route:
-                        tau = pheromone[i][j] ** alpha
-                        eta = (1 / dist[i][j]) ** beta
-                        probs.append((j, tau * eta))
-                total = sum(p for _, p in probs)
-                r = random.random() * total
-                s = 0
-                for j, p in probs:
-                    s += p
-                    if s >= r:
-                        route.append(j)
-                        break
-            route_length = sum(dist[route[i]][route[(i+1)%n]] for i in range(n))
-            all_routes.append((route, route_length))
-            if route_length < best_length:
-                best_route, best_length = route, route_length
+        with timer.phase("construct"):
+            for _ in range(n_ants):
+                route = [rng.randint(0, n-1)]
+                while len(route) < n:
+                    i = route[-1]
+                    dist_i = row(i)
+                    probs = []
+                    for j in range(n):
+                        if j not in route:
+                            tau = pheromone[i][j] ** alpha
+                            eta = (1 / dist_i[j]) ** beta
+                            probs.append((j, tau * eta))
+                    total = sum(p for _, p in probs)
+                    r = rng.random() * total
+                    s = 0
+                    for j, p in probs:
+                        s += p
+                        if s >= r:
+                            route.append(j)
+                            break
+                route_length = sum(float(dist[route[i]][route[(i+1)%n]]) for i in range(n))
+                all_routes.append((route, route_length))
+                if route_length < best_length:
+                    best_route, best_length = route, route_length
 
         # evaporate pheromone
-        pheromone = [[(1-rho) * pheromone[i][j] for j in range(n)] for i in range(n)]
+        with timer.phase("evaporate"):
+            pheromone = [[(1-rho) * pheromone[i][j] for j in range(n)] for i in range(n)]
 
         # deposit pheromone
-        for route, length in all_routes:
-            for i in range(n):
-                a, b = route[i], route[(i+1)%n]
-                pheromone[a][b] += Q / length
-                pheromone[b][a] += Q / length
+        with timer.phase("deposit"):
+            for route, length in all_routes:
+                for i in range(n):
+                    a, b = route[i], route[(i+1)%n]
+                    pheromone[a][b] += Q / length
+                    pheromone[b][a] += Q / length
+        timer.iteration_end(iteration, best_length)
+
+        checkpointer.maybe_save(iteration + 1, lambda: {
+            "algorithm": "aco",
+            "iteration": iteration + 1,
+            "pheromone": np.array(pheromone, dtype=np.float64),
+            "best_route": np.array(best_route),
+            "best_length": best_length,
+            "rng": rng_state(rng),
+        })
 
+    timer.close()
+    checkpointer.close()
     return best_route, best_length
 
 # ---------- Example ----------
-cities = [(0,0), (1,5), (5,2), (6,6), (8,3)]
-best_route, best_length = ACO_TSP(cities)
+if __name__ == "__main__":
+    cities = [(0,0), (1,5), (5,2), (6,6), (8,3)]
+    best_route, best_length = ACO_TSP(cities)
 
-print("Best Route (city indices):", best_route)
-print("Best Route Length:", best_length)
+    print("Best Route (city indices):", best_route)
+    print("Best Route Length:", best_length)
 
 
 
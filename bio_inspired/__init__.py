@@ -0,0 +1,25 @@
+"""
+Common entry point for the bio-inspired optimizers in this repository.
+
+    from bio_inspired import Problem, solve, solve_many, compare
+
+    sphere = Problem(lambda X: (X ** 2).sum(axis=1), bounds=(-10, 10), dim=5, name="sphere")
+    results = solve_many([("gwo", sphere, {}), ("pso", sphere, {}), ("gea", sphere, {})])
+    print(compare(results))
+"""
+from .problem import ENCODINGS, EvaluationTracker, Problem, Result
+from .registry import available_optimizers, compare, get_optimizer, register, solve, solve_many
+from . import adapters  # noqa: F401  (registers the built-in optimizers)
+
+__all__ = [
+    "ENCODINGS",
+    "EvaluationTracker",
+    "Problem",
+    "Result",
+    "available_optimizers",
+    "compare",
+    "get_optimizer",
+    "register",
+    "solve",
+    "solve_many",
+]
@@ -0,0 +1,149 @@
+"""
+Registry adapters for the algorithms in the repository root.
+
+The algorithm modules are imported inside each adapter so that optional
+dependencies (matplotlib for PSO, OpenCV for the cellular denoiser) are only
+needed by the optimizers that use them.
+"""
+from .registry import register
+from .rng import spawn
+
+
+@register("gwo", encodings=("real",))
+def gwo(problem, tracker, num_wolves=20, max_iter=30, observer=None, seed=None, backend=None, surrogate=None):
+    from grey_wolf_optimiser import GWO
+
+    lb, ub = problem.uniform_bounds()
+    GWO(num_wolves=num_wolves, max_iter=max_iter, dim=problem.dim, lb=lb, ub=ub,
+        fitness_fn=_minimizing(problem, tracker), verbose=False, observer=observer, seed=seed,
+        backend=backend, fitness_batch=_minimizing_batch(problem, tracker), surrogate=surrogate)
+    return {}
+
+
+@register("gwo_adaptive", encodings=("real",))
+def gwo_adaptive(problem, tracker, num_wolves=20, max_iter=30, seed=None, observer=None, **options):
+    from grey_wolf_optimiser import GWO_adaptive
+
+    lb, ub = problem.uniform_bounds()
+    _, _, info = GWO_adaptive(num_wolves=num_wolves, max_iter=max_iter, dim=problem.dim, lb=lb, ub=ub,
+                              fitness_batch=_minimizing_batch(problem, tracker), seed=seed,
+                              observer=observer, **options)
+    return {"stop_reason": info["stop_reason"], "extra": info}
+
+
+@register("pso", encodings=("real",))
+def pso(problem, tracker, num_particles=30, iterations=100, vel_fraction=0.1, seed=None, backend=None,
+        **options):
+    lb, ub = problem.uniform_bounds()
+    vmax = vel_fraction * (ub - lb)
+    if backend is not None:
+        # Array version of the core loop (no inertia schedules or stop criteria)
+        from .kernels import pso as kernel_pso
+
+        kernel_pso(_minimizing_batch(problem, tracker), num_particles, iterations, problem.dim,
+                   pos_bound=(lb, ub), vel_bound=(-vmax, vmax), backend=backend, seed=seed, **options)
+        return {}
+
+    from particle_swarm_optimisation import run_pso
+
+    _, _, stop_reason, _ = run_pso(num_particles=num_particles, iterations=iterations,
+                                   pos_bound=(lb, ub), vel_bound=(-vmax, vmax),
+                                   show_plots=False, seed=seed, fitness_fn=_minimizing(problem, tracker),
+                                   dim=problem.dim, verbose=False, **options)
+    return {"stop_reason": stop_reason}
+
+
+@register("gea", encodings=("real",))
+def gea(problem, tracker, pop_size=30, generations=50, crossover_rate=0.8, mutation_rate=0.1,
+        mutation_step=None, seed=None, observer=None):
+    from gene_expression_algorithm import VectorizedGeneExpressionAlgorithm
+
+    lb, ub = problem.uniform_bounds()
+    if mutation_step is None:
+        mutation_step = (ub - lb) / 30  # same ratio as 0.1 on the original (-1, 2) range
+    VectorizedGeneExpressionAlgorithm(
+        pop_size=pop_size, generations=generations, crossover_rate=crossover_rate,
+        mutation_rate=mutation_rate, fitness_batch=tracker.maximizing_batch, seed=seed,
+        bounds=(lb, ub), dim=problem.dim, mutation_step=mutation_step, clip=True,
+    ).run(verbose=False, observer=observer)
+    return {}
+
+
+@register("ga", encodings=("binary",))
+def ga(problem, tracker, pop_size=20, generations=100, mutation_rate=0.05, selector="tournament", seed=None,
+       observer=None):
+    # Tournament by default: roulette / sus need non-negative fitness, and
+    # maximizing_scalar is negative on minimization problems
+    from genetic_algorithm import run_ga
+
+    # Separate streams for the initial population and the run itself
+    population_rng, run_rng = spawn(seed, 2)
+    population = ["".join(population_rng.choice(["0", "1"], problem.dim)) for _ in range(pop_size)]
+    run_ga(population, generations=generations, mutation_rate=mutation_rate, seed=run_rng,
+           selector=selector, fitness_fn=tracker.maximizing_scalar, observer=observer)
+    return {}
+
+
+@register("resource_ga", encodings=("resource",))
+def resource_ga(problem, tracker, generations=100, **options):
+    from resource_allocation import ResourceAllocationGA
+
+    engine = ResourceAllocationGA(problem.data["problem"], **options)
+    allocations, value, history = engine.run(generations)
+    per_generation = engine.pop_size - engine.elitism
+    return {
+        "best": allocations,
+        "best_value": value,
+        "evaluations": engine.evaluations,
+        "history": [(engine.pop_size + g * per_generation, v) for g, v in enumerate(history)],
+    }
+
+
+@register("aco", encodings=("permutation",))
+def aco(problem, tracker, n_ants=10, n_iterations=50, **options):
+    from ant_colony_optimisation import ACO_TSP
+
+    route, length = ACO_TSP(problem.data["cities"], n_ants=n_ants, n_iterations=n_iterations, **options)
+    return {"best": route, "best_value": length, "evaluations": n_ants * n_iterations, "history": []}
+
+
+@register("cuckoo", encodings=("knapsack",))
+def cuckoo(problem, tracker, n_nests=10, pa=0.25, max_iter=5, seed=None):
+    from cuckoo_search_algorithm import cuckoo_search
+
+    data = problem.data
+    solution, value, evaluations = cuckoo_search(data["values"], data["weights"], data["capacity"],
+                                                 n_nests=n_nests, pa=pa, max_iter=max_iter, seed=seed)
+    return {"best": solution, "best_value": float(value), "evaluations": evaluations, "history": []}
+
+
+@register("ca_denoise", encodings=("image",))
+def ca_denoise(problem, tracker, steps=3, multires=False, **options):
+    from cellular_parallism import (run_pca_noise_reduction, run_pca_noise_reduction_color,
+                                    run_pca_noise_reduction_color_multires, run_pca_noise_reduction_multires)
+
+    image = problem.data["image"]
+    if multires:
+        run = run_pca_noise_reduction_color_multires if image.ndim == 3 else run_pca_noise_reduction_multires
+        denoised, stats = run(image, steps=steps, **options)
+        return {"best": denoised, "best_value": None, "evaluations": stats["pixels_processed"],
+                "history": [], "extra": stats}
+    if image.ndim == 3:
+        denoised = run_pca_noise_reduction_color(image, steps=steps)
+    else:
+        denoised = run_pca_noise_reduction(image, steps=steps)
+    # One "evaluation" per cell update
+    return {"best": denoised, "best_value": None, "evaluations": image.size * steps, "history": []}
+
+
+def _minimizing(problem, tracker):
+    # Scalar objective as a cost to minimize (GWO and run_pso minimize)
+    if problem.minimize:
+        return tracker.scalar
+    return lambda x: -tracker.scalar(x)
+
+
+def _minimizing_batch(problem, tracker):
+    if problem.minimize:
+        return tracker.batch
+    return lambda X: -tracker.batch(X)
@@ -0,0 +1,238 @@
+"""
+Cross-algorithm benchmark suite on standard continuous test functions.
+
+Runs GWO, PSO and GEA (through the registry) on Sphere, Rastrigin,
+Rosenbrock, Ackley and Griewank under an equal evaluation budget and records
+evaluations per second, evaluations/time to reach a target error, final
+error and peak traced memory. Results are written as JSON (machine readable,
+suitable for diffing against a stored baseline) and printed as comparison
+tables.
+
+    python -m bio_inspired.benchmarks --dims 2 10 100 --budget 5000 --out bench.json
+    python -m bio_inspired.benchmarks --dims 2 10 100 --baseline bench.json   # flag regressions
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from .problem import Problem
+from .registry import solve
+
+
+# ---------- Test functions (batch: (n, dim) -> (n,), global minimum 0) ----------
+def sphere(X):
+    return np.sum(X ** 2, axis=1)
+
+
+def rastrigin(X):
+    return 10.0 * X.shape[1] + np.sum(X ** 2 - 10.0 * np.cos(2 * np.pi * X), axis=1)
+
+
+def rosenbrock(X):
+    return np.sum(100.0 * (X[:, 1:] - X[:, :-1] ** 2) ** 2 + (1 - X[:, :-1]) ** 2, axis=1)
+
+
+def ackley(X):
+    d = X.shape[1]
+    return (-20.0 * np.exp(-0.2 * np.sqrt(np.sum(X ** 2, axis=1) / d))
+            - np.exp(np.sum(np.cos(2 * np.pi * X), axis=1) / d) + 20.0 + np.e)
+
+
+def griewank(X):
+    i = np.sqrt(np.arange(1, X.shape[1] + 1))
+    return 1.0 + np.sum(X ** 2, axis=1) / 4000.0 - np.prod(np.cos(X / i), axis=1)
+
+
+# name -> (function, (lower, upper))
+FUNCTIONS = {
+    "sphere": (sphere, (-5.12, 5.12)),
+    "rastrigin": (rastrigin, (-5.12, 5.12)),
+    "rosenbrock": (rosenbrock, (-5.0, 10.0)),
+    "ackley": (ackley, (-32.768, 32.768)),
+    "griewank": (griewank, (-600.0, 600.0)),
+}
+
+ALGORITHMS = ("gwo", "pso", "gea")
+POPULATION = 30
+
+
+def make_problem(name, dim):
+    fn, bounds = FUNCTIONS[name]
+    return Problem(fn, bounds=bounds, dim=dim, name=f"{name}-{dim}d")
+
+
+def budget_options(algorithm, budget, seed):
+    """Population/iteration settings spending (at most) `budget` evaluations."""
+    iterations = max(1, budget // POPULATION - 1)
+    if algorithm == "gwo":
+        return {"num_wolves": POPULATION, "max_iter": iterations, "seed": seed}
+    if algorithm == "pso":
+        return {"num_particles": POPULATION, "iterations": iterations, "seed": seed}
+    if algorithm == "gea":
+        return {"pop_size": POPULATION, "generations": iterations, "seed": seed}
+    raise ValueError(f"No budget settings for {algorithm!r}")
+
+
+class TargetWatch:
+    """Objective wrapper noting when the best value first reaches the target."""
+
+    def __init__(self, fn, target):
+        self.fn = fn
+        self.target = target
+        self.start = None
+        self.evaluations = 0
+        self.hit_time = None
+        self.hit_evaluations = None
+
+    def __call__(self, X):
+        values = self.fn(X)
+        self.evaluations += len(values)
+        if self.hit_time is None and values.min() <= self.target:
+            self.hit_time = time.perf_counter() - self.start
+            self.hit_evaluations = self.evaluations
+        return values
+
+
+def run_case(algorithm, function, dim, budget, target, seed=0, measure_memory=True):
+    """One benchmark record (a dict) for algorithm x function x dim."""
+    base = make_problem(function, dim)
+    watch = TargetWatch(base.objective, target)
+    problem = Problem(watch, bounds=(base.lower, base.upper), dim=dim, name=base.name)
+    options = budget_options(algorithm, budget, seed)
+
+    watch.start = time.perf_counter()
+    result = solve(algorithm, problem, **options)
+
+    peak = None
+    if measure_memory:
+        # Separate traced run: tracemalloc slows Python code, so it must not
+        # be mixed into the timed run above
+        tracemalloc.start()
+        solve(algorithm, make_problem(function, dim), **options)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "algorithm": algorithm,
+        "function": function,
+        "dim": dim,
+        "budget": budget,
+        "evaluations": result.evaluations,
+        "seconds": result.timings["total"],
+        "evaluations_per_sec": result.evaluations_per_sec,
+        "final_error": result.best_value,  # every function has minimum 0
+        "target": target,
+        "evaluations_to_target": watch.hit_evaluations,
+        "time_to_target": watch.hit_time,
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_suite(functions=tuple(FUNCTIONS), dims=(2, 10, 100, 1000), algorithms=ALGORITHMS,
+              budget=5000, target=1e-2, seed=0, measure_memory=True, verbose=True):
+    # Warm-up: adapters import their modules lazily; keep that out of the timings
+    for algorithm in algorithms:
+        solve(algorithm, make_problem("sphere", 2), **budget_options(algorithm, 2 * POPULATION, seed))
+
+    records = []
+    for function in functions:
+        for dim in dims:
+            for algorithm in algorithms:
+                record = run_case(algorithm, function, dim, budget, target, seed, measure_memory)
+                records.append(record)
+                if verbose:
+                    print(f"{algorithm:<4} {function:<10} d={dim:<5} error={record['final_error']:.3e} "
+                          f"{record['evaluations_per_sec']:>10.0f} evals/s", file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "budget": budget,
+            "target": target,
+            "seed": seed,
+        },
+        "results": records,
+    }
+
+
+def format_tables(suite):
+    """One markdown table per function comparing the algorithms at each dimension."""
+    def fmt(value, spec):
+        return "-" if value is None else format(value, spec)
+
+    out = []
+    for function in dict.fromkeys(r["function"] for r in suite["results"]):
+        out.append(f"\n### {function}\n")
+        out.append("| dim | algorithm | final error | evals/s | evals to target | time to target (s) | peak mem (KiB) |")
+        out.append("|----:|:----------|------------:|--------:|----------------:|-------------------:|---------------:|")
+        for r in suite["results"]:
+            if r["function"] != function:
+                continue
+            memory = None if r["peak_memory_bytes"] is None else r["peak_memory_bytes"] / 1024
+            out.append(f"| {r['dim']} | {r['algorithm']} | {r['final_error']:.3e} | "
+                       f"{r['evaluations_per_sec']:.0f} | {fmt(r['evaluations_to_target'], 'd')} | "
+                       f"{fmt(r['time_to_target'], '.3f')} | {fmt(memory, '.0f')} |")
+    return "\n".join(out)
+
+
+def find_regressions(current, baseline, throughput_tolerance=0.2, error_tolerance=0.5):
+    """
+    Compare two suite outputs case by case.
+
+    A case regresses when evaluations/s drop by more than throughput_tolerance
+    (relative) or the final error grows by more than error_tolerance (relative,
+    with an absolute floor at the target). Returns human-readable messages.
+    """
+    key = lambda r: (r["algorithm"], r["function"], r["dim"])
+    old = {key(r): r for r in baseline["results"]}
+    messages = []
+    for r in current["results"]:
+        b = old.get(key(r))
+        if b is None:
+            continue
+        name = "{} {} d={}".format(*key(r))
+        if r["evaluations_per_sec"] < (1 - throughput_tolerance) * b["evaluations_per_sec"]:
+            messages.append(f"{name}: throughput {b['evaluations_per_sec']:.0f} -> "
+                            f"{r['evaluations_per_sec']:.0f} evals/s")
+        allowed = max(b["final_error"] * (1 + error_tolerance), r["target"])
+        if r["final_error"] > allowed:
+            messages.append(f"{name}: final error {b['final_error']:.3e} -> {r['final_error']:.3e}")
+    return messages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--functions", nargs="+", default=list(FUNCTIONS), choices=list(FUNCTIONS))
+    parser.add_argument("--dims", nargs="+", type=int, default=[2, 10, 100, 1000])
+    parser.add_argument("--algorithms", nargs="+", default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument("--budget", type=int, default=5000, help="evaluations per run")
+    parser.add_argument("--target", type=float, default=1e-2, help="error counted as reaching the optimum")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced memory run")
+    parser.add_argument("--out", help="write JSON results here")
+    parser.add_argument("--baseline", help="JSON results to check for regressions")
+    args = parser.parse_args(argv)
+
+    suite = run_suite(args.functions, args.dims, args.algorithms, args.budget, args.target,
+                      args.seed, measure_memory=not args.no_memory)
+    print(format_tables(suite))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(suite, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = find_regressions(suite, json.load(f))
+        for message in regressions:
+            print("REGRESSION:", message)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Periodic checkpoints of optimizer state, for resuming pre-empted runs.
+
+Algorithms take `checkpoint` (a Checkpointer or a file path) and
+`resume_from` (a path written by a previous run):
+
+    checkpointer = make_checkpointer(checkpoint)
+    state = load_checkpoint(resume_from, "pso") if resume_from else None
+    ...
+    for t in range(start, iterations):
+        ...
+        checkpointer.maybe_save(t + 1, lambda: {"iteration": t + 1, ...})
+    checkpointer.close()
+
+A checkpoint is one .npz file. NumPy arrays in the state are stored as
+arrays; everything else (scalars, short lists, RNG state) goes into a JSON
+entry. Python floats survive JSON unchanged, so a resumed run with the same
+arguments continues bit-identically.
+
+The state function is only called when a checkpoint is due. Its arrays
+must be snapshots the run will not modify afterwards (fresh or copied
+arrays); the file is then written by a background thread so iterations do
+not wait for the disk. At most one write is pending: the next save waits
+for the previous one. Files are written to "<path>.tmp" and renamed, so a
+crash mid-write leaves the previous checkpoint intact.
+"""
+import json
+import os
+import random
+import threading
+
+import numpy as np
+
+
+def rng_state(rng=random):
+    """JSON-able state of a random.Random (or the random module) or np.random.Generator."""
+    if hasattr(rng, "bit_generator"):
+        return rng.bit_generator.state
+    version, internal, gauss_next = rng.getstate()
+    return [version, list(internal), gauss_next]
+
+
+def set_rng_state(rng, state):
+    """Inverse of rng_state."""
+    if hasattr(rng, "bit_generator"):
+        rng.bit_generator.state = state
+    else:
+        version, internal, gauss_next = state
+        rng.setstate((version, tuple(internal), gauss_next))
+
+
+class _NullCheckpointer:
+    def maybe_save(self, iteration, state_fn):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_CHECKPOINTER = _NullCheckpointer()
+
+
+class Checkpointer:
+    """Writes the state every `every` iterations to `path` (npz, optionally compressed)."""
+
+    def __init__(self, path, every=10, compress=False):
+        self.path = os.fspath(path)
+        self.every = every
+        self.compress = compress
+        self.saves = 0
+        self._thread = None
+        self._error = None
+
+    def due(self, iteration):
+        return iteration % self.every == 0
+
+    def maybe_save(self, iteration, state_fn):
+        if self.due(iteration):
+            self.save(state_fn())
+
+    def save(self, state):
+        arrays = {key: value for key, value in state.items() if isinstance(value, np.ndarray)}
+        meta = {key: value for key, value in state.items() if not isinstance(value, np.ndarray)}
+        # Serialize now: the lists in `meta` keep changing after this call
+        arrays["__meta__"] = np.array(json.dumps(meta))
+        self.wait()
+        self._thread = threading.Thread(target=self._write, args=(arrays,), name="checkpoint-writer")
+        self._thread.start()
+        self.saves += 1
+
+    def _write(self, arrays):
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                (np.savez_compressed if self.compress else np.savez)(f, **arrays)
+            os.replace(tmp, self.path)
+        except Exception as exc:  # re-raised in the optimizer's thread by wait()
+            self._error = exc
+
+    def wait(self):
+        """Block until the pending write (if any) is on disk."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self):
+        self.wait()
+
+
+def make_checkpointer(checkpoint):
+    """Checkpointer for a path or Checkpointer; NULL_CHECKPOINTER for None."""
+    if checkpoint is None:
+        return NULL_CHECKPOINTER
+    if isinstance(checkpoint, Checkpointer):
+        return checkpoint
+    return Checkpointer(checkpoint)
+
+
+def load_checkpoint(path, algorithm=None):
+    """State dict saved by Checkpointer.save; checks the "algorithm" entry if given."""
+    with np.load(path, allow_pickle=False) as data:
+        state = json.loads(str(data["__meta__"]))
+        state.update((key, data[key]) for key in data.files if key != "__meta__")
+    if algorithm is not None and state.get("algorithm") != algorithm:
+        raise ValueError(f"{path} is a {state.get('algorithm')!r} checkpoint, not {algorithm!r}")
+    return state
@@ -0,0 +1,281 @@
+"""
+Per-iteration hot-path timing hooks for the optimizers.
+
+Algorithms take an `observer` argument (one observer, a list of them, or
+None) and wrap their phases:
+
+    timer = make_timer(observer, "gwo")
+    for t in range(start, max_iter):
+        timer.iteration_start(t)
+        with timer.phase("update"):
+            ...
+        with timer.phase("evaluate"):
+            ...
+        timer.iteration_end(t, best_value)
+    timer.close()
+
+Phases are labelled with the iteration passed to iteration_start (after a
+resume, the real iteration rather than a count from 0). close() flushes the
+sinks but leaves them open, so one sink can record several runs; close it
+(or use it as a context manager) when done.
+
+Phases used by the algorithms: "evaluate", "select", "update", and for ACO
+"construct", "evaporate", "deposit".
+
+With observer=None make_timer returns NULL_TIMER, whose phase() hands back
+one shared no-op context manager, so the disabled cost is a method call and
+an empty with-block per phase (tens of nanoseconds).
+
+Built-in sinks: RollingSummary (in-memory per-phase statistics), CSVSink and
+JSONLSink (event export) and ProfilerMarkers (named marker calls that show
+up in cProfile output and in `perf` with `python -X perf`).
+"""
+import csv
+import json
+import time
+import types
+from collections import defaultdict, deque
+
+
+class Observer:
+    """Base class; override any of the hooks."""
+
+    def on_phase(self, algorithm, iteration, phase, seconds):
+        pass
+
+    def on_phase_start(self, algorithm, iteration, phase):
+        pass
+
+    def on_iteration(self, algorithm, iteration, best_value, seconds):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class _NullContext:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_CONTEXT = _NullContext()
+
+
+class _NullTimer:
+    enabled = False
+
+    def phase(self, name):
+        return _NULL_CONTEXT
+
+    def iteration_start(self, iteration):
+        pass
+
+    def iteration_end(self, iteration, best_value=None):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class _Phase:
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        timer = self.timer
+        for observer in timer.observers:
+            observer.on_phase_start(timer.algorithm, timer.iteration, self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        timer = self.timer
+        for observer in timer.observers:
+            observer.on_phase(timer.algorithm, timer.iteration, self.name, seconds)
+        return False
+
+
+class PhaseTimer:
+    enabled = True
+
+    def __init__(self, observers, algorithm):
+        self.observers = list(observers)
+        self.algorithm = algorithm
+        self.iteration = 0
+        self._phases = {}
+        self._iteration_start = time.perf_counter()
+
+    def phase(self, name):
+        # One reusable context object per phase name (phases do not nest with themselves)
+        try:
+            return self._phases[name]
+        except KeyError:
+            context = self._phases[name] = _Phase(self, name)
+            return context
+
+    def iteration_start(self, iteration):
+        """Label the following phases with the optimizer's (0-based) iteration."""
+        self.iteration = iteration
+
+    def iteration_end(self, iteration, best_value=None):
+        now = time.perf_counter()
+        for observer in self.observers:
+            observer.on_iteration(self.algorithm, iteration, best_value, now - self._iteration_start)
+        self._iteration_start = now
+        self.iteration = iteration + 1  # for loops that do not call iteration_start
+
+    def close(self):
+        # The sinks belong to the caller (they may record several runs): only flush them
+        for observer in self.observers:
+            observer.flush()
+
+
+def make_timer(observer, algorithm):
+    """PhaseTimer for an observer or list of observers; NULL_TIMER for None."""
+    if observer is None:
+        return NULL_TIMER
+    if isinstance(observer, (list, tuple)):
+        return PhaseTimer(observer, algorithm) if observer else NULL_TIMER
+    return PhaseTimer([observer], algorithm)
+
+
+# ---------- Sinks ----------
+class RollingSummary(Observer):
+    """Per-phase totals for the whole run plus statistics over the last `window` calls."""
+
+    def __init__(self, window=100):
+        self.window = window
+        self.recent = defaultdict(lambda: deque(maxlen=window))
+        self.totals = defaultdict(float)
+        self.counts = defaultdict(int)
+        self.iterations = 0
+
+    def on_phase(self, algorithm, iteration, phase, seconds):
+        self.recent[phase].append(seconds)
+        self.totals[phase] += seconds
+        self.counts[phase] += 1
+
+    def on_iteration(self, algorithm, iteration, best_value, seconds):
+        self.iterations += 1
+
+    def summary(self):
+        grand_total = sum(self.totals.values()) or 1.0
+        out = {}
+        for phase, total in self.totals.items():
+            recent = self.recent[phase]
+            out[phase] = {
+                "calls": self.counts[phase],
+                "total": total,
+                "share": total / grand_total,
+                "recent_mean": sum(recent) / len(recent),
+                "recent_max": max(recent),
+            }
+        return out
+
+    def report(self):
+        lines = [f"{'Phase':<10} | {'Calls':>7} | {'Total (s)':>10} | {'Share':>6} | "
+                 f"{'Recent mean (ms)':>16} | {'Recent max (ms)':>15}",
+                 "-" * 80]
+        for phase, s in sorted(self.summary().items(), key=lambda item: -item[1]["total"]):
+            lines.append(f"{phase:<10} | {s['calls']:>7} | {s['total']:>10.4f} | {s['share']:>6.1%} | "
+                         f"{s['recent_mean'] * 1e3:>16.4f} | {s['recent_max'] * 1e3:>15.4f}")
+        return "\n".join(lines)
+
+
+class CSVSink(Observer):
+    """One row per phase: algorithm, iteration, phase, seconds."""
+
+    def __init__(self, path):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(["algorithm", "iteration", "phase", "seconds"])
+
+    def on_phase(self, algorithm, iteration, phase, seconds):
+        self._writer.writerow([algorithm, iteration, phase, f"{seconds:.9f}"])
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class JSONLSink(Observer):
+    """One JSON object per phase and per iteration."""
+
+    def __init__(self, path):
+        self._file = open(path, "w")
+
+    def on_phase(self, algorithm, iteration, phase, seconds):
+        self._file.write(json.dumps({"event": "phase", "algorithm": algorithm, "iteration": iteration,
+                                     "phase": phase, "seconds": seconds}) + "\n")
+
+    def on_iteration(self, algorithm, iteration, best_value, seconds):
+        self._file.write(json.dumps({"event": "iteration", "algorithm": algorithm, "iteration": iteration,
+                                     "best_value": best_value, "seconds": seconds}) + "\n")
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def _marker(name):
+    # An empty function whose code object carries `name`, so profilers list it under that name
+    def marker():
+        pass
+    code = marker.__code__.replace(co_name=name, co_qualname=name) \
+        if hasattr(marker.__code__, "co_qualname") else marker.__code__.replace(co_name=name)
+    return types.FunctionType(code, {}, name)
+
+
+class ProfilerMarkers(Observer):
+    """
+    Calls an empty function named "<algorithm>.<phase>.begin" / ".end" around
+    every phase. Under cProfile these appear as separate entries with call
+    counts; under `perf record` with `python -X perf` they appear as named
+    frames, marking phase boundaries on the timeline.
+    """
+
+    def __init__(self):
+        self._markers = {}
+
+    def _get(self, algorithm, phase, edge):
+        key = (algorithm, phase, edge)
+        try:
+            return self._markers[key]
+        except KeyError:
+            marker = self._markers[key] = _marker(f"{algorithm}.{phase}.{edge}")
+            return marker
+
+    def on_phase_start(self, algorithm, iteration, phase):
+        self._get(algorithm, phase, "begin")()
+
+    def on_phase(self, algorithm, iteration, phase, seconds):
+        self._get(algorithm, phase, "end")()
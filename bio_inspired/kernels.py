@@ -0,0 +1,529 @@
+"""
+Compiled kernels for the loops that do not vectorize cleanly.
+
+Kernels:
+    construct_tours - ACO tour building (per-ant roulette over unvisited cities)
+    construct_tours_candidates
+                    - the same over each city's k nearest neighbours only
+                    (nearest unvisited city when all of them are visited)
+    two_opt         - best-improvement 2-opt on one tour
+    gwo_update      - per-wolf, per-dimension GWO position update
+    pso_update      - per-particle, per-dimension PSO velocity/position update
+
+Every kernel has three backends:
+    "python" - plain loops, interpreted (the reference implementation)
+    "numba"  - the same loops compiled with numba.njit(cache=True); the
+               machine code is cached on disk (__pycache__), so only the first
+               run on a machine pays for compilation
+    "numpy"  - array formulation (vectorized over ants, wolves or particles)
+"auto" picks numba when it is installed and numpy otherwise.
+
+Kernels take their random numbers as arguments instead of drawing them, so
+all backends give identical results from the same seed. The drivers
+aco_tsp, gwo and pso run whole optimizations on a chosen backend; ACO_TSP
+and GWO delegate to them when called with backend=...
+
+    python -m bio_inspired.kernels      # backend timings on the same seeds
+"""
+import argparse
+import time
+
+import numpy as np
+
+from .instrumentation import make_timer
+from .rng import make_rng
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+BACKENDS = ("python", "numpy", "numba")
+
+
+# ---------- Loop kernels (python backend; compiled for the numba backend) ----------
+def _construct_tours_loop(weights, starts, uniforms):
+    n_ants = starts.shape[0]
+    n = weights.shape[0]
+    routes = np.empty((n_ants, n), dtype=np.int64)
+    visited = np.zeros(n, dtype=np.bool_)
+    for k in range(n_ants):
+        visited[:] = False
+        current = starts[k]
+        routes[k, 0] = current
+        visited[current] = True
+        for step in range(1, n):
+            total = 0.0
+            for j in range(n):
+                if not visited[j]:
+                    total += weights[current, j]
+            r = uniforms[k, step] * total
+            s = 0.0
+            chosen = -1
+            for j in range(n):
+                if not visited[j]:
+                    if chosen < 0:
+                        chosen = j  # fallback if rounding leaves s < r
+                    s += weights[current, j]
+                    if s >= r:
+                        chosen = j
+                        break
+            routes[k, step] = chosen
+            visited[chosen] = True
+            current = chosen
+    return routes
+
+
+def _construct_tours_candidates_loop(weights, candidates, coords, starts, uniforms):
+    n_ants = starts.shape[0]
+    n, k = candidates.shape
+    routes = np.empty((n_ants, n), dtype=np.int64)
+    visited = np.zeros(n, dtype=np.bool_)
+    for ant in range(n_ants):
+        visited[:] = False
+        current = starts[ant]
+        routes[ant, 0] = current
+        visited[current] = True
+        for step in range(1, n):
+            total = 0.0
+            for c in range(k):
+                if not visited[candidates[current, c]]:
+                    total += weights[current, c]
+            chosen = -1
+            if total > 0:
+                r = uniforms[ant, step] * total
+                s = 0.0
+                for c in range(k):
+                    j = candidates[current, c]
+                    if not visited[j]:
+                        if chosen < 0:
+                            chosen = j  # fallback if rounding leaves s < r
+                        s += weights[current, c]
+                        if s >= r:
+                            chosen = j
+                            break
+            else:
+                # every candidate visited: nearest unvisited city
+                best = np.inf
+                for j in range(n):
+                    if not visited[j]:
+                        dx = coords[j, 0] - coords[current, 0]
+                        dy = coords[j, 1] - coords[current, 1]
+                        d = dx * dx + dy * dy
+                        if d < best:
+                            best = d
+                            chosen = j
+            routes[ant, step] = chosen
+            visited[chosen] = True
+            current = chosen
+    return routes
+
+
+def _two_opt_loop(route, dist, max_passes):
+    route = route.copy()
+    n = route.shape[0]
+    for _ in range(max_passes):
+        best_delta = -1e-10
+        best_i = -1
+        best_j = -1
+        for i in range(n - 1):
+            a = route[i]
+            b = route[i + 1]
+            for j in range(i + 2, n):
+                if i == 0 and j == n - 1:
+                    continue  # same edge pair
+                c = route[j]
+                d = route[(j + 1) % n]
+                delta = dist[a, c] + dist[b, d] - dist[a, b] - dist[c, d]
+                if delta < best_delta:
+                    best_delta = delta
+                    best_i = i
+                    best_j = j
+        if best_i < 0:
+            break
+        # reverse route[best_i + 1 .. best_j]
+        lo = best_i + 1
+        hi = best_j
+        while lo < hi:
+            tmp = route[lo]
+            route[lo] = route[hi]
+            route[hi] = tmp
+            lo += 1
+            hi -= 1
+    return route
+
+
+def _gwo_update_loop(wolves, leaders, a, r1, r2, lb, ub):
+    n, dim = wolves.shape
+    out = np.empty_like(wolves)
+    for i in range(n):
+        for d in range(dim):
+            A = 2 * a * r1[i, d] - a
+            C = 2 * r2[i, d]
+            x = wolves[i, d]
+            X1 = leaders[0, d] - A * abs(C * leaders[0, d] - x)
+            X2 = leaders[1, d] - A * abs(C * leaders[1, d] - x)
+            X3 = leaders[2, d] - A * abs(C * leaders[2, d] - x)
+            out[i, d] = max(lb, min(ub, (X1 + X2 + X3) / 3))
+    return out
+
+
+def _pso_update_loop(position, velocity, pbest, gbest, w, c1, c2, r1, r2, vmin, vmax, lb, ub):
+    n, dim = position.shape
+    new_position = np.empty_like(position)
+    new_velocity = np.empty_like(velocity)
+    for i in range(n):
+        for d in range(dim):
+            cognitive = c1 * r1[i, d] * (pbest[i, d] - position[i, d])
+            social = c2 * r2[i, d] * (gbest[d] - position[i, d])
+            v = max(vmin, min(vmax, w * velocity[i, d] + cognitive + social))
+            new_velocity[i, d] = v
+            new_position[i, d] = max(lb, min(ub, position[i, d] + v))
+    return new_position, new_velocity
+
+
+# ---------- NumPy kernels ----------
+def _construct_tours_numpy(weights, starts, uniforms):
+    n_ants, n = len(starts), len(weights)
+    ants = np.arange(n_ants)
+    routes = np.empty((n_ants, n), dtype=np.int64)
+    unvisited = np.ones((n_ants, n), dtype=bool)
+    current = starts.astype(np.int64)
+    routes[:, 0] = current
+    unvisited[ants, current] = False
+    for step in range(1, n):
+        cumulative = np.cumsum(weights[current] * unvisited, axis=1)
+        r = uniforms[:, step] * cumulative[:, -1]
+        # first unvisited city where the running sum reaches r (as in the loop)
+        hit = (cumulative >= r[:, None]) & unvisited
+        current = np.where(hit.any(axis=1), np.argmax(hit, axis=1), np.argmax(unvisited, axis=1))
+        routes[:, step] = current
+        unvisited[ants, current] = False
+    return routes
+
+
+def _construct_tours_candidates_numpy(weights, candidates, coords, starts, uniforms):
+    n_ants, n = len(starts), len(candidates)
+    ants = np.arange(n_ants)
+    routes = np.empty((n_ants, n), dtype=np.int64)
+    unvisited = np.ones((n_ants, n), dtype=bool)
+    current = starts.astype(np.int64)
+    routes[:, 0] = current
+    unvisited[ants, current] = False
+    for step in range(1, n):
+        candidate = candidates[current]
+        open_ = unvisited[ants[:, None], candidate]
+        cumulative = np.cumsum(weights[current] * open_, axis=1)
+        r = uniforms[:, step] * cumulative[:, -1]
+        hit = (cumulative >= r[:, None]) & open_
+        column = np.where(hit.any(axis=1), np.argmax(hit, axis=1), np.argmax(open_, axis=1))
+        current = candidate[ants, column]
+        stuck = np.nonzero(cumulative[:, -1] <= 0)[0]
+        if len(stuck):
+            previous = routes[stuck, step - 1]
+            d = ((coords[None, :, 0] - coords[previous, 0][:, None]) ** 2
+                 + (coords[None, :, 1] - coords[previous, 1][:, None]) ** 2)
+            d[~unvisited[stuck]] = np.inf
+            current[stuck] = np.argmin(d, axis=1)
+        routes[:, step] = current
+        unvisited[ants, current] = False
+    return routes
+
+
+def _two_opt_numpy(route, dist, max_passes):
+    route = route.copy()
+    n = len(route)
+    i, j = np.triu_indices(n, k=2)
+    keep = ~((i == 0) & (j == n - 1))
+    i, j = i[keep], j[keep]
+    for _ in range(max_passes):
+        a, b = route[i], route[i + 1]
+        c, d = route[j], route[(j + 1) % n]
+        delta = dist[a, c] + dist[b, d] - dist[a, b] - dist[c, d]
+        if not len(delta):
+            break
+        best = int(np.argmin(delta))  # first minimum in (i, j) order, like the loop
+        if delta[best] >= -1e-10:
+            break
+        route[i[best] + 1:j[best] + 1] = route[i[best] + 1:j[best] + 1][::-1].copy()
+    return route
+
+
+def _gwo_update_numpy(wolves, leaders, a, r1, r2, lb, ub):
+    A = 2 * a * r1 - a
+    C = 2 * r2
+    X1 = leaders[0] - A * np.abs(C * leaders[0] - wolves)
+    X2 = leaders[1] - A * np.abs(C * leaders[1] - wolves)
+    X3 = leaders[2] - A * np.abs(C * leaders[2] - wolves)
+    return np.clip((X1 + X2 + X3) / 3, lb, ub)
+
+
+def _pso_update_numpy(position, velocity, pbest, gbest, w, c1, c2, r1, r2, vmin, vmax, lb, ub):
+    cognitive = c1 * r1 * (pbest - position)
+    social = c2 * r2 * (gbest - position)
+    velocity = np.clip(w * velocity + cognitive + social, vmin, vmax)
+    return np.clip(position + velocity, lb, ub), velocity
+
+
+_LOOP_KERNELS = {
+    "construct_tours": _construct_tours_loop,
+    "construct_tours_candidates": _construct_tours_candidates_loop,
+    "two_opt": _two_opt_loop,
+    "gwo_update": _gwo_update_loop,
+    "pso_update": _pso_update_loop,
+}
+_NUMPY_KERNELS = {
+    "construct_tours": _construct_tours_numpy,
+    "construct_tours_candidates": _construct_tours_candidates_numpy,
+    "two_opt": _two_opt_numpy,
+    "gwo_update": _gwo_update_numpy,
+    "pso_update": _pso_update_numpy,
+}
+_compiled = {}
+
+
+def resolve_backend(backend="auto"):
+    if backend == "auto":
+        return "numba" if njit is not None else "numpy"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; choose from {BACKENDS} or 'auto'")
+    if backend == "numba" and njit is None:
+        raise ImportError("backend='numba' needs numba installed (pip install numba)")
+    return backend
+
+
+def get_kernels(backend="auto"):
+    """Dict of kernel name -> function for a backend."""
+    backend = resolve_backend(backend)
+    if backend == "python":
+        return _LOOP_KERNELS
+    if backend == "numpy":
+        return _NUMPY_KERNELS
+    if not _compiled:
+        _compiled.update((name, njit(cache=True)(fn)) for name, fn in _LOOP_KERNELS.items())
+    return _compiled
+
+
+# ---------- Drivers ----------
+def _tour_lengths(routes, dist):
+    # Fancy indexing reads only the tour edges, also from a memory-mapped matrix
+    return dist[routes, np.roll(routes, -1, axis=-1)].sum(axis=-1, dtype=np.float64)
+
+
+def _euclidean_tour_lengths(routes, coords):
+    step = coords[np.roll(routes, -1, axis=-1)] - coords[routes]
+    return np.sqrt((step ** 2).sum(axis=-1)).sum(axis=-1)
+
+
+def aco_tsp(cities, n_ants=10, n_iterations=50, alpha=1, beta=2, rho=0.5, Q=100, two_opt=False,
+            backend="auto", seed=None, observer=None, dist=None, neighbors=None, neighbor_dist=None):
+    """
+    ACO_TSP on arrays, with tour construction (and optional 2-opt of each
+    iteration's best tour) on the chosen backend. Returns (best_route, best_length).
+
+    dist: optional precomputed distance matrix.
+
+    neighbors: optional (n, k) candidate lists, e.g. instance.neighbors of a
+    tsp_io instance (neighbor_dist: their distances, from the coordinates
+    when None). Ants then choose among the k nearest unvisited cities and
+    pheromone is kept for those edges only, so memory is O(n * k) instead of
+    O(n^2); tour lengths come from dist when given, else from the
+    coordinates (Euclidean). In this mode a memory-mapped tsp_io dist is
+    indexed in place: only the tour edges (and 2-opt lookups) are paged in,
+    nothing is copied or converted.
+
+    Without neighbors pheromone, the heuristic 1 / dist^beta and the
+    construction weights are dense n x n float64 arrays, so the whole of
+    dist is read once and memory is O(n^2) whatever its storage.
+    """
+    kernels = get_kernels(backend)
+    rng = make_rng(seed)
+    timer = make_timer(observer, "aco")
+    n = len(cities)
+    coords = np.asarray(cities, dtype=np.float64)
+    if dist is not None:
+        dist = np.asarray(dist)  # ndarray view of a memmap, no copy or dtype change
+    if neighbors is not None:
+        candidates = np.asarray(neighbors, dtype=np.int64)
+        if neighbor_dist is None:
+            neighbor_dist = np.sqrt(((coords[candidates] - coords[:, None, :]) ** 2).sum(axis=-1))
+        eta = (1.0 / np.asarray(neighbor_dist, dtype=np.float64)) ** beta
+        pheromone = np.ones(candidates.shape)
+        tour_lengths = ((lambda routes: _tour_lengths(routes, dist)) if dist is not None
+                        else (lambda routes: _euclidean_tour_lengths(routes, coords)))
+    else:
+        if dist is None:
+            dist = np.sqrt(((coords[:, None, :] - coords[None, :, :]) ** 2).sum(axis=-1))
+        with np.errstate(divide="ignore"):
+            eta = np.where(np.eye(n, dtype=bool), 0.0, 1.0 / dist) ** beta
+        pheromone = np.ones((n, n))
+        tour_lengths = lambda routes: _tour_lengths(routes, dist)
+    if two_opt and dist is None:
+        raise ValueError("two_opt with neighbors needs dist")
+    best_route, best_length = None, float("inf")
+
+    for iteration in range(n_iterations):
+        timer.iteration_start(iteration)
+        with timer.phase("construct"):
+            starts = rng.integers(0, n, n_ants)
+            uniforms = rng.random((n_ants, n))
+            if neighbors is not None:
+                routes = kernels["construct_tours_candidates"](pheromone ** alpha * eta, candidates, coords,
+                                                               starts, uniforms)
+            else:
+                routes = kernels["construct_tours"](pheromone ** alpha * eta, starts, uniforms)
+            lengths = tour_lengths(routes)
+            k = int(np.argmin(lengths))
+            if two_opt:
+                routes[k] = kernels["two_opt"](routes[k], dist, n * n)
+                lengths[k] = tour_lengths(routes[k])
+            if lengths[k] < best_length:
+                best_route, best_length = routes[k].tolist(), float(lengths[k])
+
+        with timer.phase("evaporate"):
+            pheromone *= (1 - rho)
+
+        with timer.phase("deposit"):
+            following = np.roll(routes, -1, axis=1)
+            deposit = np.repeat(Q / lengths, n)
+            if neighbors is not None:
+                # Edges outside the candidate lists carry no pheromone
+                for a, b in ((routes.ravel(), following.ravel()), (following.ravel(), routes.ravel())):
+                    match = candidates[a] == b[:, None]
+                    edge = match.any(axis=1)
+                    np.add.at(pheromone, (a[edge], np.argmax(match[edge], axis=1)), deposit[edge])
+            else:
+                np.add.at(pheromone, (routes.ravel(), following.ravel()), deposit)
+                np.add.at(pheromone, (following.ravel(), routes.ravel()), deposit)
+        timer.iteration_end(iteration, best_length)
+
+    timer.close()
+    return best_route, best_length
+
+
+def _top_three(fitness):
+    return np.argsort(fitness, kind="stable")[:3]
+
+
+def gwo(fitness_batch, num_wolves=20, max_iter=30, dim=5, lb=-10, ub=10,
+        backend="auto", seed=None, observer=None):
+    """GWO with the position update on the chosen backend. Returns (alpha, best_fitness)."""
+    kernels = get_kernels(backend)
+    rng = make_rng(seed)
+    timer = make_timer(observer, "gwo")
+    wolves = rng.uniform(lb, ub, (num_wolves, dim))
+    fitness = np.asarray(fitness_batch(wolves), dtype=np.float64)
+    leaders = wolves[_top_three(fitness)]
+
+    for t in range(max_iter):
+        timer.iteration_start(t)
+        a = 2 - (2 * t / max_iter)
+        with timer.phase("update"):
+            r1 = rng.random((num_wolves, dim))
+            r2 = rng.random((num_wolves, dim))
+            wolves = kernels["gwo_update"](wolves, leaders, a, r1, r2, float(lb), float(ub))
+        with timer.phase("evaluate"):
+            fitness = np.asarray(fitness_batch(wolves), dtype=np.float64)
+        with timer.phase("select"):
+            leaders = wolves[_top_three(fitness)]
+        timer.iteration_end(t, float(fitness.min()))
+
+    timer.close()
+    return leaders[0], float(fitness.min())
+
+
+def pso(fitness_batch, num_particles=30, iterations=100, dim=2, w=0.5, c1=1.5, c2=1.5,
+        pos_bound=(-20, 20), vel_bound=(-2, 2), backend="auto", seed=None, observer=None):
+    """run_pso's core loop with the update on the chosen backend. Returns (gbest_pos, gbest_f, evaluations)."""
+    kernels = get_kernels(backend)
+    rng = make_rng(seed)
+    timer = make_timer(observer, "pso")
+    lb, ub = map(float, pos_bound)
+    vmin, vmax = map(float, vel_bound)
+    position = rng.uniform(lb, ub, (num_particles, dim))
+    velocity = rng.uniform(vmin, vmax, (num_particles, dim))
+    pbest = position.copy()
+    pbest_f = np.asarray(fitness_batch(position), dtype=np.float64)
+    best = int(np.argmin(pbest_f))
+    gbest, gbest_f = pbest[best].copy(), float(pbest_f[best])
+    evaluations = num_particles
+
+    for t in range(iterations):
+        timer.iteration_start(t)
+        with timer.phase("evaluate"):
+            f = np.asarray(fitness_batch(position), dtype=np.float64)
+            improved = f < pbest_f
+            pbest[improved] = position[improved]
+            pbest_f[improved] = f[improved]
+            best = int(np.argmin(f))
+            if f[best] < gbest_f:
+                gbest, gbest_f = position[best].copy(), float(f[best])
+        evaluations += num_particles
+
+        with timer.phase("update"):
+            r1 = rng.random((num_particles, dim))
+            r2 = rng.random((num_particles, dim))
+            position, velocity = kernels["pso_update"](position, velocity, pbest, gbest, w, c1, c2,
+                                                       r1, r2, vmin, vmax, lb, ub)
+        timer.iteration_end(t, gbest_f)
+
+    timer.close()
+    return gbest, gbest_f, evaluations
+
+
+# ---------- Benchmark ----------
+def _sphere(X):
+    return np.sum(X ** 2, axis=1)
+
+
+def benchmark_kernels(backends=None, seed=0, cities=60, dim=30, repeats=3):
+    """
+    Time each driver (and 2-opt alone) on every available backend with the
+    same seed and check that all backends return the same result. The first
+    numba call compiles (or loads from the disk cache) and is reported apart.
+    """
+    backends = backends or [b for b in BACKENDS if b != "numba" or njit is not None]
+    coords = make_rng(seed).uniform(0, 100, (cities, 2))
+    dist = np.sqrt(((coords[:, None, :] - coords[None, :, :]) ** 2).sum(axis=-1))
+    tour = make_rng(seed).permutation(cities)
+    cases = {
+        "aco construct": lambda b: aco_tsp(coords, n_ants=20, n_iterations=20, backend=b, seed=seed)[1],
+        "2-opt": lambda b: float(_tour_lengths(get_kernels(b)["two_opt"](tour, dist, cities * cities), dist)),
+        "gwo update": lambda b: gwo(_sphere, num_wolves=50, max_iter=100, dim=dim, backend=b, seed=seed)[1],
+        "pso update": lambda b: pso(_sphere, num_particles=50, iterations=100, dim=dim, backend=b, seed=seed)[1],
+    }
+
+    results = {}
+    print(f"{'Kernel':<14} | {'Backend':<7} | {'Best time (s)':>13} | {'First call (s)':>14} | {'Result':>14}")
+    print("-" * 75)
+    for name, run in cases.items():
+        values = {}
+        for backend in backends:
+            start = time.perf_counter()
+            values[backend] = run(backend)
+            first = time.perf_counter() - start
+            times = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                run(backend)
+                times.append(time.perf_counter() - start)
+            results[(name, backend)] = {"seconds": min(times), "first_call": first, "result": values[backend]}
+            print(f"{name:<14} | {backend:<7} | {min(times):>13.4f} | {first:>14.4f} | {values[backend]:>14.6g}")
+        if len(set(values.values())) > 1:
+            print(f"  warning: backends disagree on {name}: {values}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cities", type=int, default=60)
+    parser.add_argument("--dim", type=int, default=30)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+    benchmark_kernels(args.backends, args.seed, args.cities, args.dim, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
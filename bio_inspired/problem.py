@@ -0,0 +1,144 @@
+"""
+Common problem and result types shared by every registered optimizer.
+"""
+import time
+
+import numpy as np
+
+ENCODINGS = ("real", "binary", "permutation", "knapsack", "resource", "image")
+
+
+class Problem:
+    """
+    What to optimize, independent of the algorithm.
+
+    Args:
+        objective: Batch objective. For "real" encoding it maps an (n, dim)
+                   array to n values; for "binary" it maps an array of n
+                   chromosomes (as unsigned ints of dim bits) to n values.
+                   Encodings whose algorithms score candidates themselves
+                   ("permutation", "knapsack", "resource", "image") take
+                   their instance from `data` instead.
+        bounds: (lower, upper), each a number or one value per dimension.
+        dim: Number of decision variables (bits for "binary").
+        encoding: One of ENCODINGS.
+        minimize: Direction of the objective.
+        data: Instance data for the self-scoring encodings, e.g.
+              {"cities": [...]} or {"values": ..., "weights": ..., "capacity": ...}.
+    """
+
+    def __init__(self, objective=None, bounds=None, dim=None, encoding="real",
+                 minimize=True, name="problem", data=None):
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown encoding {encoding!r}; choose from {ENCODINGS}")
+        self.objective = objective
+        self.dim = dim
+        self.encoding = encoding
+        self.minimize = minimize
+        self.name = name
+        self.data = data or {}
+        if bounds is not None:
+            self.lower = np.broadcast_to(np.asarray(bounds[0], dtype=np.float64), (dim,)).copy()
+            self.upper = np.broadcast_to(np.asarray(bounds[1], dtype=np.float64), (dim,)).copy()
+        else:
+            self.lower = self.upper = None
+
+    def uniform_bounds(self):
+        """(lb, ub) as scalars; for algorithms that only support a box with equal sides."""
+        if self.lower is None:
+            raise ValueError(f"Problem {self.name!r} has no bounds.")
+        if np.ptp(self.lower) or np.ptp(self.upper):
+            raise ValueError(f"Problem {self.name!r} has per-dimension bounds; "
+                             "this optimizer needs the same bounds for every dimension.")
+        return float(self.lower[0]), float(self.upper[0])
+
+    def better(self, a, b):
+        return a < b if self.minimize else a > b
+
+    def __repr__(self):
+        return f"Problem(name={self.name!r}, encoding={self.encoding!r}, dim={self.dim})"
+
+
+class EvaluationTracker:
+    """
+    Wraps Problem.objective for one run: counts evaluations, times them and
+    keeps the best point seen with a best-so-far history of
+    (evaluations, best_value) pairs recorded at every improvement.
+    """
+
+    def __init__(self, problem):
+        self.problem = problem
+        self.evaluations = 0
+        self.objective_time = 0.0
+        self.best_x = None
+        self.best_value = None
+        self.history = []
+
+    def batch(self, X):
+        X = np.asarray(X)
+        start = time.perf_counter()
+        values = np.asarray(self.problem.objective(X), dtype=np.float64)
+        self.objective_time += time.perf_counter() - start
+        self.evaluations += len(values)
+
+        i = int(np.argmin(values) if self.problem.minimize else np.argmax(values))
+        if self.best_value is None or self.problem.better(values[i], self.best_value):
+            self.best_value = float(values[i])
+            self.best_x = X[i].copy()
+            self.history.append((self.evaluations, self.best_value))
+        return values
+
+    def scalar(self, x):
+        """Objective of a single point (for algorithms that evaluate one at a time)."""
+        return float(self.batch(np.asarray(x)[None])[0])
+
+    def maximizing_batch(self, X):
+        """Batch objective turned into a fitness to maximize."""
+        values = self.batch(X)
+        return -values if self.problem.minimize else values
+
+    def maximizing_scalar(self, x):
+        value = self.scalar(x)
+        return -value if self.problem.minimize else value
+
+
+class Result:
+    """Outcome of one optimizer run."""
+
+    def __init__(self, algorithm, problem, best, best_value, history, evaluations,
+                 timings, stop_reason=None, extra=None):
+        self.algorithm = algorithm
+        self.problem = problem
+        self.best = best
+        self.best_value = best_value
+        self.history = history          # [(evaluations, best_value), ...]
+        self.evaluations = evaluations
+        self.timings = timings          # {"total": s, "objective": s}
+        self.stop_reason = stop_reason
+        self.extra = extra or {}
+
+    @property
+    def evaluations_per_sec(self):
+        total = self.timings.get("total", 0.0)
+        return self.evaluations / total if total else float("inf")
+
+    def as_dict(self):
+        best = self.best
+        if isinstance(best, np.ndarray) and best.size <= 10000:
+            best = best.tolist()
+        return {
+            "algorithm": self.algorithm,
+            "problem": self.problem.name,
+            "best": best if not isinstance(best, np.ndarray) else None,
+            "best_value": self.best_value,
+            "evaluations": self.evaluations,
+            "evaluations_per_sec": self.evaluations_per_sec,
+            "timings": dict(self.timings),
+            "stop_reason": self.stop_reason,
+            "history": [list(h) for h in self.history],
+        }
+
+    def __repr__(self):
+        return (f"Result(algorithm={self.algorithm!r}, problem={self.problem.name!r}, "
+                f"best_value={self.best_value!r}, evaluations={self.evaluations}, "
+                f"total={self.timings.get('total', 0.0):.3f}s)")
@@ -0,0 +1,107 @@
+"""
+Name -> optimizer registry with a uniform solve() entry point.
+
+An optimizer is a function fn(problem, tracker, **options) returning a dict
+with any of: best, best_value, evaluations, history, stop_reason, extra.
+Missing fields are filled from the EvaluationTracker, so adapters that call
+tracker.batch / tracker.scalar get evaluation counts and history for free.
+"""
+import inspect
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .problem import EvaluationTracker, Result
+from .rng import spawn_seeds
+
+_OPTIMIZERS = {}
+
+
+def register(name, encodings=("real",)):
+    """Decorator adding an optimizer under `name` for the given problem encodings."""
+    def decorator(fn):
+        if name in _OPTIMIZERS:
+            raise ValueError(f"Optimizer {name!r} is already registered.")
+        fn.encodings = tuple(encodings)
+        _OPTIMIZERS[name] = fn
+        return fn
+    return decorator
+
+
+def get_optimizer(name):
+    try:
+        return _OPTIMIZERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown optimizer {name!r}; "
+                         f"available: {available_optimizers()}") from None
+
+
+def available_optimizers(encoding=None):
+    """Registered names, optionally only those that accept `encoding`."""
+    return sorted(name for name, fn in _OPTIMIZERS.items()
+                  if encoding is None or encoding in fn.encodings)
+
+
+def solve(name, problem, **options):
+    """Run optimizer `name` on `problem` and return a Result."""
+    optimizer = get_optimizer(name)
+    if problem.encoding not in optimizer.encodings:
+        raise ValueError(f"Optimizer {name!r} does not support {problem.encoding!r} problems "
+                         f"(supports {optimizer.encodings}).")
+    tracker = EvaluationTracker(problem)
+    start = time.perf_counter()
+    out = optimizer(problem, tracker, **options)
+    total = time.perf_counter() - start
+
+    return Result(
+        algorithm=name,
+        problem=problem,
+        best=out.get("best", tracker.best_x),
+        best_value=out.get("best_value", tracker.best_value),
+        history=out.get("history", tracker.history),
+        evaluations=out.get("evaluations", tracker.evaluations),
+        timings={"total": total, "objective": tracker.objective_time},
+        stop_reason=out.get("stop_reason"),
+        extra=out.get("extra"),
+    )
+
+
+def _solve_job(job):
+    name, problem, options = job
+    return solve(name, problem, **options)
+
+
+def _accepts_seed(name):
+    parameters = inspect.signature(get_optimizer(name)).parameters.values()
+    return any(p.name == "seed" or p.kind is p.VAR_KEYWORD for p in parameters)
+
+
+def solve_many(jobs, max_workers=None, processes=False, seed=None):
+    """
+    Run several (name, problem, options) jobs concurrently; results keep job order.
+
+    Threads by default. processes=True uses a process pool, which needs
+    picklable problems (module-level objective functions, no lambdas).
+
+    With a seed, job i gets the i-th spawned child stream as its "seed"
+    option (unless it sets one), so results do not depend on scheduling.
+    """
+    jobs = [(name, problem, dict(options)) for name, problem, options in jobs]
+    if seed is not None:
+        for (name, _, options), child in zip(jobs, spawn_seeds(seed, len(jobs))):
+            if "seed" not in options and _accepts_seed(name):
+                options["seed"] = child
+    executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor(max_workers=max_workers) as pool:
+        return list(pool.map(_solve_job, jobs))
+
+
+def compare(results):
+    """Plain-text comparison table of Results (quality and throughput)."""
+    lines = [f"{'Algorithm':<12} | {'Problem':<16} | {'Best value':>14} | {'Evaluations':>11} | "
+             f"{'Time (s)':>9} | {'Evals/s':>11}",
+             "-" * 90]
+    for r in results:
+        value = f"{r.best_value:>14.6g}" if isinstance(r.best_value, (int, float)) else f"{'-':>14}"
+        lines.append(f"{r.algorithm:<12} | {r.problem.name:<16} | {value} | {r.evaluations:>11} | "
+                     f"{r.timings['total']:>9.3f} | {r.evaluations_per_sec:>11.0f}")
+    return "\n".join(lines)
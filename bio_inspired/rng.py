@@ -0,0 +1,76 @@
+"""
+Random streams for the optimizers.
+
+Every optimizer takes `seed`, which may be None (fresh OS entropy), an int,
+a np.random.SeedSequence or a np.random.Generator (a random.Random is also
+accepted by the pure-Python optimizers). Nothing uses the global `random`
+or `np.random` state, so concurrent runs neither contend on one generator
+nor change each other's results.
+
+Parallel work (islands, solve_many jobs, colonies) gets independent streams
+by spawning children of one SeedSequence:
+
+    streams = spawn(seed, num_islands)        # list of Generators
+    seeds = spawn_seeds(seed, num_islands)    # picklable SeedSequences for worker processes
+"""
+import numbers
+import random
+
+import numpy as np
+
+
+def seed_sequence(seed=None):
+    """Root SeedSequence for a seed; a Generator contributes a fresh child of its own sequence."""
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return seed.bit_generator.seed_seq.spawn(1)[0]
+    if seed is None or isinstance(seed, numbers.Integral):
+        return np.random.SeedSequence(None if seed is None else int(seed))
+    raise TypeError(f"Cannot derive a random stream from {type(seed).__name__}")
+
+
+def make_rng(seed=None):
+    """np.random.Generator for a seed; a Generator is returned unchanged."""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed_sequence(seed))
+
+
+def python_random(seed=None):
+    """
+    random.Random for the list-based optimizers (ACO, GWO, PSO, GEA).
+
+    An int seeds it directly (random.Random(seed)); a SeedSequence or
+    Generator seeds it with 128 bits drawn from that stream. A random.Random
+    is returned unchanged.
+    """
+    if isinstance(seed, random.Random):
+        return seed
+    if seed is None or isinstance(seed, numbers.Integral):
+        return random.Random(None if seed is None else int(seed))
+    if isinstance(seed, np.random.SeedSequence):
+        words = seed.generate_state(4)
+    else:
+        words = make_rng(seed).integers(0, 2 ** 32, 4, dtype=np.uint32)
+    return random.Random(int.from_bytes(np.asarray(words, dtype=np.uint32).tobytes(), "little"))
+
+
+def spawn_seeds(seed, count):
+    """count independent child SeedSequences (cheap to pickle to worker processes)."""
+    return seed_sequence(seed).spawn(count)
+
+
+def spawn(seed, count):
+    """count independent Generators."""
+    return [np.random.default_rng(child) for child in spawn_seeds(seed, count)]
+
+
+def child_seed(seed, *key):
+    """
+    The SeedSequence at position `key` of seed's spawn tree, without spawning
+    the intermediate levels: child_seed(s, i, j) is spawn_seeds(spawn_seeds(s, n)[i], m)[j].
+    """
+    root = seed_sequence(seed)
+    return np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + tuple(key),
+                                  pool_size=root.pool_size)
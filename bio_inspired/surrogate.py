@@ -0,0 +1,287 @@
+"""
+Surrogate pre-screening for expensive objectives.
+
+Every truly evaluated point goes into an archive; a cheap model fitted on
+the archive predicts the fitness of each new population, and only the most
+promising fraction is sent to the real objective. The rest get +inf for
+that iteration (no personal / leader update) but keep moving.
+
+    run_pso(..., fitness_fn=simulate, surrogate="rbf")
+    GWO(..., fitness_fn=simulate, surrogate=SurrogateScreen("knn", fraction=0.5))
+
+Algorithms take `surrogate` as None, a model name ("rbf", "knn") or a
+SurrogateScreen, and call make_surrogate() on it. Until the archive holds
+min_archive points every candidate is evaluated. Selection only uses the
+ranking of the predictions, so the models need not be accurate, only
+ordered roughly right near the swarm.
+
+`python -m bio_inspired.surrogate` reports the true evaluations each
+algorithm needs with and without screening to reach the quality of the
+unscreened run.
+"""
+import argparse
+import math
+
+import numpy as np
+
+
+# ---------- Archive ----------
+class Archive:
+    """Growing (X, y) store of truly evaluated points."""
+
+    def __init__(self, dim, capacity=256):
+        self.X = np.empty((capacity, dim))
+        self.y = np.empty(capacity)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def add(self, X, y):
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+        keep = np.isfinite(y)
+        X, y = X[keep], y[keep]
+        needed = self.size + len(y)
+        if needed > len(self.y):
+            capacity = max(needed, 2 * len(self.y))
+            self.X = np.concatenate([self.X[:self.size], np.empty((capacity - self.size, self.X.shape[1]))])
+            self.y = np.concatenate([self.y[:self.size], np.empty(capacity - self.size)])
+        self.X[self.size:needed] = X
+        self.y[self.size:needed] = y
+        self.size = needed
+
+    def latest(self, n=None):
+        """The last n points (all when n is None)."""
+        start = 0 if n is None else max(0, self.size - n)
+        return self.X[start:self.size], self.y[start:self.size]
+
+
+# ---------- Models ----------
+def _squared_distances(A, B):
+    d = (A ** 2).sum(axis=1)[:, None] + (B ** 2).sum(axis=1)[None, :] - 2 * A @ B.T
+    return np.maximum(d, 0)
+
+
+class KNNSurrogate:
+    """Inverse-distance weighted mean of the k nearest archive points."""
+
+    def __init__(self, k=5):
+        self.k = k
+
+    def fit(self, X, y):
+        self.X, self.y = X.copy(), y.copy()
+        return self
+
+    def predict(self, X):
+        d = np.sqrt(_squared_distances(np.asarray(X, dtype=np.float64), self.X))
+        k = min(self.k, len(self.y))
+        nearest = np.argpartition(d, k - 1, axis=1)[:, :k]
+        weights = 1 / (np.take_along_axis(d, nearest, axis=1) + 1e-12)
+        return (weights * self.y[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+
+class RBFSurrogate:
+    """Cubic radial basis function interpolant with a linear tail."""
+
+    def fit(self, X, y):
+        n, dim = X.shape
+        self.centers = X.copy()
+        P = np.hstack([np.ones((n, 1)), X])
+        system = np.zeros((n + dim + 1, n + dim + 1))
+        system[:n, :n] = np.sqrt(_squared_distances(X, X)) ** 3
+        system[:n, n:] = P
+        system[n:, :n] = P.T
+        rhs = np.concatenate([y, np.zeros(dim + 1)])
+        # lstsq: repeated points make the system singular
+        coefficients = np.linalg.lstsq(system, rhs, rcond=None)[0]
+        self.weights, self.tail = coefficients[:n], coefficients[n:]
+        return self
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        phi = np.sqrt(_squared_distances(X, self.centers)) ** 3
+        return phi @ self.weights + self.tail[0] + X @ self.tail[1:]
+
+
+MODELS = {"rbf": RBFSurrogate, "knn": KNNSurrogate}
+
+
+# ---------- Screening ----------
+class SurrogateScreen:
+    """
+    Picks which candidates of a population get a true evaluation.
+
+    model       - "rbf", "knn" or an object with fit(X, y) / predict(X)
+    fraction    - share of each population sent to the objective (at least
+                  one, or the min_keep the algorithm asks for)
+    min_archive - evaluate everything until the archive holds this many
+                  points (default: 2 * dim + 2, fixed on first use)
+    max_points  - the model is fitted on this many most recent archive
+                  points (the region the population is in) to bound its cost
+
+    Counters: true_evaluations, screened_out, refits.
+    """
+
+    def __init__(self, model="rbf", fraction=0.3, min_archive=None, max_points=256):
+        self.model = MODELS[model]() if isinstance(model, str) else model
+        self.fraction = fraction
+        self.min_archive = min_archive
+        self.max_points = max_points
+        self.archive = None
+        self.true_evaluations = 0
+        self.screened_out = 0
+        self.refits = 0
+        self._stale = True
+
+    def observe(self, X, y):
+        """Add truly evaluated points to the archive."""
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        if self.archive is None:
+            self.archive = Archive(X.shape[1])
+            if self.min_archive is None:
+                self.min_archive = 2 * X.shape[1] + 2
+        self.archive.add(X, y)
+        self.true_evaluations += len(X)
+        self._stale = True
+
+    def select(self, X, min_keep=1):
+        """
+        Indices (ascending) of the candidates in X worth a true evaluation;
+        at least min_keep of them (e.g. GWO needs three finite leaders).
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        n = len(X)
+        if self.archive is None or len(self.archive) < self.min_archive:
+            return np.arange(n)
+        if self._stale:
+            self.model.fit(*self.archive.latest(self.max_points))
+            self.refits += 1
+            self._stale = False
+        keep = min(n, max(min_keep, math.ceil(self.fraction * n)))
+        predicted = self.model.predict(X)
+        chosen = np.sort(np.argsort(predicted, kind="stable")[:keep])
+        self.screened_out += n - keep
+        return chosen
+
+    def evaluate(self, X, fitness_fn, min_keep=1):
+        """
+        Fitness of every row of X: the objective for the selected rows,
+        +inf for the screened-out ones. Evaluated rows go into the archive.
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        chosen = self.select(X, min_keep)
+        values = np.full(len(X), np.inf)
+        for i in chosen:
+            values[i] = fitness_fn(X[i].tolist())
+        self.observe(X[chosen], values[chosen])
+        return values.tolist()
+
+    def stats(self):
+        return {
+            "true_evaluations": self.true_evaluations,
+            "screened_out": self.screened_out,
+            "archive_size": 0 if self.archive is None else len(self.archive),
+            "refits": self.refits,
+        }
+
+
+def make_surrogate(surrogate):
+    """None, a model name ("rbf", "knn") or a SurrogateScreen -> SurrogateScreen or None."""
+    if isinstance(surrogate, str):
+        return SurrogateScreen(surrogate)
+    return surrogate
+
+
+# ---------- Benchmark ----------
+class _CountingObjective:
+    """Scalar wrapper of a batch benchmark function that records the best value after each call."""
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.best = []
+
+    def __call__(self, x):
+        value = float(self.fn(np.asarray(x, dtype=np.float64)[None, :])[0])
+        self.best.append(min(value, self.best[-1]) if self.best else value)
+        return value
+
+    def evaluations_to(self, target):
+        """True evaluations until the best value reached target (None if it never did)."""
+        reached = np.nonzero(np.asarray(self.best) <= target)[0]
+        return int(reached[0]) + 1 if len(reached) else None
+
+
+def _run(algorithm, objective, dim, bounds, iterations, population, seed, surrogate):
+    lb, ub = bounds
+    if algorithm == "gwo":
+        from grey_wolf_optimiser import GWO
+
+        GWO(num_wolves=population, max_iter=iterations, dim=dim, lb=lb, ub=ub, fitness_fn=objective,
+            verbose=False, seed=seed, surrogate=surrogate)
+    else:
+        from particle_swarm_optimisation import run_pso
+
+        vmax = 0.1 * (ub - lb)
+        run_pso(num_particles=population, iterations=iterations, pos_bound=(lb, ub), vel_bound=(-vmax, vmax),
+                show_plots=False, seed=seed, fitness_fn=objective, dim=dim, verbose=False,
+                w_schedule="linear", surrogate=surrogate)
+
+
+def benchmark_surrogate(functions=("sphere", "rastrigin", "ackley"), dims=(5, 10), algorithms=("pso", "gwo"),
+                        models=("rbf", "knn"), fraction=0.3, iterations=100, population=30, seed=0):
+    """
+    For each case, the unscreened run sets the target (its final best value).
+    The screened runs get about the same true-evaluation budget
+    (iterations / fraction iterations) and are scored by the true
+    evaluations they needed to reach that target.
+    """
+    from .benchmarks import FUNCTIONS
+
+    print(f"{'Algorithm':<9} | {'Function':<10} | {'Dim':>3} | {'Model':<5} | {'Final best':>10} | "
+          f"{'Evals':>5} | {'Evals to target':>15} | {'Saved':>6}")
+    print("-" * 84)
+    rows = []
+    for algorithm in algorithms:
+        for name in functions:
+            fn, bounds = FUNCTIONS[name]
+            for dim in dims:
+                runs = {}
+                for model in (None,) + tuple(models):
+                    objective = _CountingObjective(fn)
+                    if model is None:
+                        screen, budget_iterations = None, iterations
+                    else:
+                        screen, budget_iterations = SurrogateScreen(model, fraction=fraction), \
+                            math.ceil(iterations / fraction)
+                    _run(algorithm, objective, dim, bounds, budget_iterations, population, seed, screen)
+                    runs[model] = objective
+                target = runs[None].best[-1]
+                baseline = runs[None].evaluations_to(target)
+                for model, objective in runs.items():
+                    to_target = objective.evaluations_to(target)
+                    saved = "-" if to_target is None else f"{1 - to_target / baseline:.0%}"
+                    print(f"{algorithm:<9} | {name:<10} | {dim:>3} | {model or '-':<5} | "
+                          f"{objective.best[-1]:>10.3e} | {len(objective.best):>5} | "
+                          f"{to_target or '-':>15} | {saved:>6}")
+                    rows.append({"algorithm": algorithm, "function": name, "dim": dim, "model": model,
+                                 "final_best": objective.best[-1], "evaluations": len(objective.best),
+                                 "evaluations_to_target": to_target, "target": target})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="True evaluations with and without surrogate screening.")
+    parser.add_argument("--functions", nargs="+", default=["sphere", "rastrigin", "ackley"])
+    parser.add_argument("--dims", nargs="+", type=int, default=[5, 10])
+    parser.add_argument("--fraction", type=float, default=0.3)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--population", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    benchmark_surrogate(args.functions, args.dims, fraction=args.fraction, iterations=args.iterations,
+                        population=args.population, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Memory-mapped TSP instances.
+
+An instance is stored as raw binary arrays next to a small JSON header:
+
+    <base>.json              header: name, source, edge weight type, and for
+                             every array its file, dtype and shape
+    <base>.coords.bin        (n, 2) float64 city coordinates
+    <base>.neighbors.bin     (n, k) int32 indices of the k nearest cities, nearest first
+    <base>.neighbor_dist.bin (n, k) float32 distances to those cities
+    <base>.distances.bin     (n, n) float32 full distance matrix (optional)
+
+load_instance() maps the arrays read-only with np.memmap: nothing is parsed
+at startup, pages are read on first touch, and every process that loads the
+same instance shares one copy in the page cache. A TSPInstance pickles as
+its path, so sending one to pool workers does not copy the arrays.
+
+Distances are planar Euclidean, so only EUC_2D instances (and CSV
+coordinates) are accepted; GEO, ATT, CEIL_2D etc. raise ValueError.
+
+The converter is run once per instance:
+
+    python -m bio_inspired.tsp_io cities.tsp depots/cities --neighbors 16
+    python -m bio_inspired.tsp_io cities.csv depots/cities --distances
+
+then
+
+    instance = load_instance("depots/cities")
+    ACO_TSP(instance.coords, neighbors=instance.neighbors, neighbor_dist=instance.neighbor_dist,
+            dist=instance.distances, backend="auto")
+
+With the neighbour tables as candidate lists the ACO kernels need O(n * k)
+memory and read the distance matrix in place (without them they build dense
+n x n arrays from it).
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy is optional; brute-force neighbours otherwise
+    cKDTree = None
+
+FORMAT_VERSION = 1
+EDGE_WEIGHT_TYPES = ("EUC_2D",)  # metrics the neighbour / distance tables are computed with
+_BLOCK_ELEMENTS = 1 << 22  # distance-block size for brute-force neighbours / matrices
+
+
+# ---------- Readers ----------
+def read_tsplib(path):
+    """(coords, header) from a TSPLIB file with a NODE_COORD_SECTION."""
+    header = {}
+    coords = []
+    in_section = False
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line == "EOF":
+                break
+            if not line:
+                continue
+            if in_section:
+                parts = line.split()
+                if not parts[0].lstrip("-").isdigit():
+                    in_section = False  # another section starts
+                else:
+                    coords.append((float(parts[1]), float(parts[2])))
+                    continue
+            if line.startswith("NODE_COORD_SECTION"):
+                in_section = True
+            elif ":" in line:
+                key, value = line.split(":", 1)
+                header[key.strip().upper()] = value.strip()
+    if not coords:
+        raise ValueError(f"{path}: no NODE_COORD_SECTION found")
+    return np.array(coords, dtype=np.float64), header
+
+
+def read_csv(path, delimiter=","):
+    """(n, 2) coordinates from a CSV of x,y or id,x,y rows (an optional header row is skipped)."""
+    with open(path) as f:
+        first = f.readline()
+    try:
+        [float(value) for value in first.split(delimiter)]
+        skip = 0
+    except ValueError:
+        skip = 1
+    data = np.loadtxt(path, delimiter=delimiter, skiprows=skip, ndmin=2)
+    return np.ascontiguousarray(data[:, -2:], dtype=np.float64)
+
+
+# ---------- Writer / converter ----------
+def _blocks(n, width):
+    step = max(1, _BLOCK_ELEMENTS // max(width, 1))
+    for start in range(0, n, step):
+        yield start, min(n, start + step)
+
+
+def nearest_neighbors(coords, k):
+    """(indices, distances) of the k nearest other cities of every city, nearest first."""
+    n = len(coords)
+    k = min(k, n - 1)
+    if cKDTree is not None:
+        distances, indices = cKDTree(coords).query(coords, k=k + 1)
+        return indices[:, 1:].astype(np.int32), distances[:, 1:].astype(np.float32)
+    indices = np.empty((n, k), dtype=np.int32)
+    distances = np.empty((n, k), dtype=np.float32)
+    for start, stop in _blocks(n, n):
+        d = np.sqrt(((coords[start:stop, None, :] - coords[None, :, :]) ** 2).sum(axis=-1))
+        d[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        part = np.argpartition(d, k - 1, axis=1)[:, :k]
+        part_d = np.take_along_axis(d, part, axis=1)
+        order = np.argsort(part_d, axis=1, kind="stable")
+        indices[start:stop] = np.take_along_axis(part, order, axis=1)
+        distances[start:stop] = np.take_along_axis(part_d, order, axis=1)
+    return indices, distances
+
+
+def write_instance(base, coords, neighbors=16, distances=False, name=None, source=None,
+                   edge_weight_type="EUC_2D"):
+    """Write coords (and neighbour / distance tables) in the memmap format; returns the header."""
+    if edge_weight_type not in EDGE_WEIGHT_TYPES:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE {edge_weight_type!r}: neighbour and distance "
+                         f"tables are planar Euclidean ({', '.join(EDGE_WEIGHT_TYPES)} only)")
+    coords = np.ascontiguousarray(coords, dtype=np.float64)
+    n = len(coords)
+    os.makedirs(os.path.dirname(os.path.abspath(base)), exist_ok=True)
+    arrays = {}
+
+    def add(key, data_or_shape, dtype):
+        path = f"{base}.{key}.bin"
+        shape = data_or_shape if isinstance(data_or_shape, tuple) else data_or_shape.shape
+        out = np.memmap(path, dtype=dtype, mode="w+", shape=shape)
+        if not isinstance(data_or_shape, tuple):
+            out[:] = data_or_shape
+        arrays[key] = {"file": os.path.basename(path), "dtype": np.dtype(dtype).str, "shape": list(shape)}
+        return out
+
+    add("coords", coords, np.float64).flush()
+    if neighbors:
+        indices, neighbor_dist = nearest_neighbors(coords, neighbors)
+        add("neighbors", indices, np.int32).flush()
+        add("neighbor_dist", neighbor_dist, np.float32).flush()
+    if distances:
+        matrix = add("distances", (n, n), np.float32)
+        for start, stop in _blocks(n, n):
+            matrix[start:stop] = np.sqrt(((coords[start:stop, None, :] - coords[None, :, :]) ** 2).sum(axis=-1))
+        matrix.flush()
+        del matrix
+
+    header = {
+        "format_version": FORMAT_VERSION,
+        "name": name or os.path.basename(base),
+        "source": source,
+        "n": n,
+        "edge_weight_type": edge_weight_type,
+        "arrays": arrays,
+    }
+    with open(f"{base}.json", "w") as f:
+        json.dump(header, f, indent=2)
+    return header
+
+
+def convert(source, base, neighbors=16, distances=False, delimiter=","):
+    """One-time conversion of a TSPLIB (.tsp) or CSV file to the memmap format."""
+    if str(source).lower().endswith(".tsp"):
+        coords, tsplib = read_tsplib(source)
+        name = tsplib.get("NAME")
+        edge_weight_type = tsplib.get("EDGE_WEIGHT_TYPE", "EUC_2D")
+    else:
+        coords = read_csv(source, delimiter)
+        name, edge_weight_type = None, "EUC_2D"
+    return write_instance(base, coords, neighbors=neighbors, distances=distances, name=name,
+                          source=os.path.basename(str(source)), edge_weight_type=edge_weight_type)
+
+
+# ---------- Loader ----------
+class TSPInstance:
+    """Read-only memory-mapped arrays of one instance (None for tables that were not written)."""
+
+    def __init__(self, base, header, arrays):
+        self.base = base
+        self.header = header
+        self.name = header["name"]
+        self.n = header["n"]
+        self.coords = arrays["coords"]
+        self.neighbors = arrays.get("neighbors")
+        self.neighbor_dist = arrays.get("neighbor_dist")
+        self.distances = arrays.get("distances")
+
+    def __len__(self):
+        return self.n
+
+    def __reduce__(self):
+        # Pickle as the path: workers map the same files instead of receiving a copy
+        return load_instance, (self.base,)
+
+    def distance_matrix(self):
+        """The stored matrix, or one computed from the coordinates (in memory)."""
+        if self.distances is not None:
+            return self.distances
+        c = np.asarray(self.coords)
+        return np.sqrt(((c[:, None, :] - c[None, :, :]) ** 2).sum(axis=-1))
+
+
+def load_instance(base):
+    """Map an instance written by write_instance/convert; base is the path without extension."""
+    base = os.fspath(base)
+    if base.endswith(".json"):
+        base = base[:-len(".json")]
+    with open(f"{base}.json") as f:
+        header = json.load(f)
+    if header.get("format_version") != FORMAT_VERSION:
+        raise ValueError(f"{base}.json: unsupported format version {header.get('format_version')}")
+    directory = os.path.dirname(os.path.abspath(base))
+    arrays = {key: np.memmap(os.path.join(directory, spec["file"]), dtype=np.dtype(spec["dtype"]),
+                             mode="r", shape=tuple(spec["shape"]))
+              for key, spec in header["arrays"].items()}
+    return TSPInstance(base, header, arrays)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="TSPLIB .tsp or CSV file")
+    parser.add_argument("base", help="output path without extension")
+    parser.add_argument("--neighbors", type=int, default=16, help="nearest neighbours per city (0: none)")
+    parser.add_argument("--distances", action="store_true", help="also write the full n x n float32 matrix")
+    parser.add_argument("--delimiter", default=",")
+    args = parser.parse_args(argv)
+    header = convert(args.source, args.base, args.neighbors, args.distances, args.delimiter)
+    print(f"{header['name']}: {header['n']} cities -> {', '.join(a['file'] for a in header['arrays'].values())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Compact integer representation for the binary-string chromosomes used by
+genetic_algorithm.py and genetic_algorithm_application_resource.py.
+
+A population is a NumPy uint64 array with one chromosome per element
+(chromosomes of up to 64 bits). String index 0 is the most significant bit,
+so to_strings(from_strings(p), n) == p and decode_fields agrees with
+int(part, 2) on the corresponding substrings.
+
+    bit-swap crossover : diff = (a ^ b) & mask; a ^= diff; b ^= diff
+    mask mutation      : population ^ masks
+    field decoding     : (population >> shift) & field_mask
+
+Strings are only needed for display (to_strings).
+"""
+import numpy as np
+
+MAX_BITS = 64
+
+
+def _check_length(length):
+    if not 0 < length <= MAX_BITS:
+        raise ValueError(f"Chromosome length must be between 1 and {MAX_BITS} bits, got {length}.")
+
+
+def from_strings(population):
+    """Binary strings -> uint64 array."""
+    _check_length(len(population[0]))
+    return np.array([int(chrom, 2) for chrom in population], dtype=np.uint64)
+
+
+def to_strings(population, length):
+    """uint64 array -> binary strings of the given length (display only)."""
+    return [format(int(chrom), f"0{length}b") for chrom in population]
+
+
+def bit_mask(bit_pos, length):
+    """Mask selecting string position bit_pos of a length-bit chromosome."""
+    return np.uint64(1 << (length - 1 - bit_pos))
+
+
+def swap_bit(population, pool_size, bit_pos, length):
+    """Swap bit_pos between consecutive pairs of the first pool_size chromosomes.
+
+    Same result as mating_pool_selection, as one XOR/AND per pair.
+    """
+    new_population = population.copy()
+    pairs = pool_size - pool_size % 2
+    a = new_population[0:pairs:2]
+    b = new_population[1:pairs:2]
+    diff = (a ^ b) & bit_mask(bit_pos, length)
+    new_population[0:pairs:2] = a ^ diff
+    new_population[1:pairs:2] = b ^ diff
+    return new_population
+
+
+def mutate(population, masks):
+    """Flip every bit set in the per-chromosome masks (1's complement on the mask)."""
+    return population ^ masks
+
+
+def random_masks(rng, count, length, rate):
+    """count mutation masks with each of the length bits set with probability rate."""
+    bits = rng.random((count, length)) < rate
+    weights = np.left_shift(np.uint64(1), np.arange(length - 1, -1, -1, dtype=np.uint64))
+    return np.bitwise_or.reduce(np.where(bits, weights, np.uint64(0)), axis=1)
+
+
+def decode_fields(population, bits_per_field, num_fields):
+    """Split each chromosome into num_fields unsigned fields (most significant first).
+
+    Returns an int64 array of shape (len(population), num_fields).
+    """
+    _check_length(bits_per_field * num_fields)
+    shifts = np.arange(num_fields - 1, -1, -1, dtype=np.uint64) * np.uint64(bits_per_field)
+    field_mask = np.uint64((1 << bits_per_field) - 1)
+    return ((population[:, None] >> shifts) & field_mask).astype(np.int64)
+
+
+def encode_fields(fields, bits_per_field):
+    """Inverse of decode_fields: (n, num_fields) field values -> uint64 chromosomes."""
+    fields = np.asarray(fields, dtype=np.uint64)
+    num_fields = fields.shape[1]
+    _check_length(bits_per_field * num_fields)
+    shifts = np.arange(num_fields - 1, -1, -1, dtype=np.uint64) * np.uint64(bits_per_field)
+    return np.bitwise_or.reduce(fields << shifts, axis=1)
+
+
+# ---------- Multi-word chromosomes ----------
+# Chromosomes longer than 64 bits are stored as a (population, num_words)
+# uint64 matrix. Each word holds 64 // bits_per_field whole fields (most
+# significant first); unused low bits of a word stay zero.
+
+def fields_per_word(bits_per_field):
+    _check_length(bits_per_field)
+    return MAX_BITS // bits_per_field
+
+
+def num_words(bits_per_field, num_fields):
+    per_word = fields_per_word(bits_per_field)
+    return -(-num_fields // per_word)
+
+
+def _word_shifts(bits_per_field):
+    per_word = fields_per_word(bits_per_field)
+    return np.arange(per_word - 1, -1, -1, dtype=np.uint64) * np.uint64(bits_per_field)
+
+
+def decode_field_words(words, bits_per_field, num_fields):
+    """(n, num_words) uint64 -> (n, num_fields) int64 field values."""
+    field_mask = np.uint64((1 << bits_per_field) - 1)
+    fields = (words[:, :, None] >> _word_shifts(bits_per_field)) & field_mask
+    return fields.reshape(len(words), -1)[:, :num_fields].astype(np.int64)
+
+
+def encode_field_words(fields, bits_per_field):
+    """Inverse of decode_field_words: (n, num_fields) -> (n, num_words) uint64."""
+    fields = np.asarray(fields, dtype=np.uint64)
+    count, num_fields = fields.shape
+    per_word = fields_per_word(bits_per_field)
+    padded = np.zeros((count, num_words(bits_per_field, num_fields) * per_word), dtype=np.uint64)
+    padded[:, :num_fields] = fields
+    padded = padded.reshape(count, -1, per_word)
+    return np.bitwise_or.reduce(padded << _word_shifts(bits_per_field), axis=2)
+
+
+def field_bit_location(field, bit, bits_per_field):
+    """(word index, uint64 mask) of bit `bit` (0 = most significant) of field `field`.
+
+    Works elementwise on integer arrays.
+    """
+    per_word = fields_per_word(bits_per_field)
+    word = field // per_word
+    shift = (per_word - 1 - field % per_word) * bits_per_field + (bits_per_field - 1 - bit)
+    return word, np.left_shift(np.uint64(1), np.asarray(shift, dtype=np.uint64))
@@ -1,5 +1,7 @@
 import numpy as np
 
+from bio_inspired.rng import make_rng
+
 # -----------------------------
 # Knapsack Problem Setup
 # -----------------------------
@@ -16,7 +18,7 @@ pa = 0.25            # discovery probability
 max_iter = 5
 
 # Fitness Function
-def fitness(solution):
+def fitness(solution, values=values, weights=weights, capacity=capacity):
     total_value = np.sum(np.array(values) * solution)
     total_weight = np.sum(np.array(weights) * solution)
     if total_weight > capacity:
@@ -24,50 +26,63 @@ def fitness(solution):
     return total_value
 
 # Generate Random Solution
-def random_solution():
-    sol = np.random.randint(0, 2, n_items)
+def random_solution(n_items=n_items, rng=None):
+    rng = make_rng(rng)
+    sol = rng.integers(0, 2, n_items)
     return sol
 
 # Levy Flight (Binary Version)
-def levy_flight(solution):
-    new_solution = solution.copy()
-    for i in range(len(solution)):
-        if np.random.rand() < 0.5:  # flip with some prob
-            new_solution[i] = 1 - new_solution[i]
-    return new_solution
+def levy_flight(solution, rng=None):
+    rng = make_rng(rng)
+    flips = rng.random(len(solution)) < 0.5  # flip each item with some prob, one batched draw
+    return np.where(flips, 1 - solution, solution)
 
 # -----------------------------
 # Cuckoo Search Algorithm
 # -----------------------------
-# Initialize nests
-nests = [random_solution() for _ in range(n_nests)]
-fitnesses = [fitness(s) for s in nests]
-
-for _ in range(max_iter):
-    # Generate new solutions via Levy flights
-    for i in range(n_nests):
-        new_sol = levy_flight(nests[i])
-        new_fit = fitness(new_sol)
-        if new_fit > fitnesses[i]:
-            nests[i] = new_sol
-            fitnesses[i] = new_fit
-    
-    # Abandon some nests with probability pa
-    for i in range(n_nests):
-        if np.random.rand() < pa:
-            nests[i] = random_solution()
-            fitnesses[i] = fitness(nests[i])
+def cuckoo_search(values=values, weights=weights, capacity=capacity,
+                  n_nests=n_nests, pa=pa, max_iter=max_iter, seed=None):
+    """Returns (best_solution, best_value, evaluations).
 
-# -----------------------------
-# Best Solution
-# -----------------------------
-best_index = np.argmax(fitnesses)
-best_solution = nests[best_index]
-best_value = fitnesses[best_index]
+    seed: int, SeedSequence or Generator (see bio_inspired.rng).
+    """
+    rng = make_rng(seed)
+    n_items = len(values)
+
+    # Initialize nests
+    nests = [random_solution(n_items, rng) for _ in range(n_nests)]
+    fitnesses = [fitness(s, values, weights, capacity) for s in nests]
+    evaluations = n_nests
+
+    for _ in range(max_iter):
+        # Generate new solutions via Levy flights
+        for i in range(n_nests):
+            new_sol = levy_flight(nests[i], rng)
+            new_fit = fitness(new_sol, values, weights, capacity)
+            evaluations += 1
+            if new_fit > fitnesses[i]:
+                nests[i] = new_sol
+                fitnesses[i] = new_fit
+
+        # Abandon some nests with probability pa
+        abandoned = rng.random(n_nests) < pa
+        for i in np.flatnonzero(abandoned):
+            nests[i] = random_solution(n_items, rng)
+            fitnesses[i] = fitness(nests[i], values, weights, capacity)
+            evaluations += 1
+
+    # -----------------------------
+    # Best Solution
+    # -----------------------------
+    best_index = np.argmax(fitnesses)
+    return nests[best_index], fitnesses[best_index], evaluations
+
+if __name__ == "__main__":
+    best_solution, best_value, _ = cuckoo_search()
 
-print("Best Solution (items taken):", best_solution)
-print("Total Value:", best_value)
-print("Total Weight:", np.sum(np.array(weights) * best_solution))
+    print("Best Solution (items taken):", best_solution)
+    print("Total Value:", best_value)
+    print("Total Weight:", np.sum(np.array(weights) * best_solution))
 
 
 '''
@@ -0,0 +1,210 @@
+"""
+Fitness memoization shared by the GA-family evaluators
+(genetic_algorithm.py, genetic_algorithm_application_resource.py,
+gene_expression_algorithm.py).
+
+Identical chromosomes (surviving elites, repeats in small binary spaces) are
+scored once. The in-memory layer is a bounded LRU; an optional shelve file
+keeps evaluations across runs of the same problem.
+
+Entries are keyed by the chromosome together with a fingerprint of the
+fitness function and its extra arguments (values, limits, flags), so one
+cache or file shared by different problems never returns another problem's
+score. Functions are fingerprinted by their code, defaults and closure
+contents, bound methods and callable objects by their instance attributes.
+Objects that cannot be described that way (no __dict__, unknown types) are
+keyed by identity: fine in memory, but a persistent store then needs an
+explicit namespace naming the problem. Arguments must not be modified in
+place while a cache uses them.
+
+Usage:
+    cache = FitnessCache(maxsize=10000, path="resource_ga.cache")
+    f = cache.get(chromosome, fitness, project_values, resource_limit)
+    print(cache.stats())
+    cache.close()
+"""
+import hashlib
+import numbers
+import shelve
+import types
+from collections import OrderedDict
+
+import numpy as np
+
+
+_PLAIN = (type(None), bool, numbers.Number, str, bytes)
+
+
+def _describe_code(code):
+    consts = ",".join(_describe_code(c) if isinstance(c, types.CodeType) else repr(c) for c in code.co_consts)
+    return f"code({hashlib.sha1(code.co_code).hexdigest()},{code.co_names},{consts})"
+
+
+def _cell_contents(cell):
+    try:
+        return cell.cell_contents
+    except ValueError:  # variable not assigned yet
+        return "<empty cell>"
+
+
+def _describe(value, pinned, seen=()):
+    """
+    (text, stable) form of a fitness function or argument. stable texts are
+    the same across runs; the others contain id() of an object appended to
+    pinned, which the caller keeps alive so the id is not reused.
+    """
+    if id(value) in seen:  # self-referencing closures / attributes
+        pinned.append(value)
+        return f"<{type(value).__qualname__} {id(value)}>", False
+    seen = seen + (id(value),)
+
+    def join(name, values):
+        parts = [_describe(v, pinned, seen) for v in values]
+        return f"{name}({','.join(text for text, _ in parts)})", all(stable for _, stable in parts)
+
+    if isinstance(value, np.ndarray):
+        return f"ndarray({value.dtype.str},{value.shape},{hashlib.sha1(value.tobytes()).hexdigest()})", True
+    if isinstance(value, _PLAIN):
+        return repr(value), True
+    if isinstance(value, (list, tuple)):
+        return join(type(value).__name__, value)
+    if isinstance(value, dict):
+        return join("dict", sorted(value.items(), key=repr))
+    if isinstance(value, types.FunctionType):
+        cells = [_cell_contents(cell) for cell in value.__closure__ or ()]
+        text, stable = join("closure", (value.__defaults__, value.__kwdefaults__, *cells))
+        return f"{value.__module__}.{value.__qualname__}:{_describe_code(value.__code__)}:{text}", stable
+    if isinstance(value, types.MethodType):
+        return join("method", (value.__func__, value.__self__))
+    if isinstance(value, (types.BuiltinFunctionType, types.ModuleType, type, np.ufunc)):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', value.__name__)}", True
+    if hasattr(value, "__dict__"):  # instances, including callable objects
+        text, stable = join("attrs", (vars(value),))
+        return f"{type(value).__module__}.{type(value).__qualname__}{text}", stable
+    pinned.append(value)
+    return f"<{type(value).__qualname__} {id(value)}>", False
+
+
+def problem_key(fn, args, pinned=None):
+    """
+    (fingerprint, stable) of a fitness function and its extra arguments.
+    Objects keyed by identity are appended to pinned (see _describe).
+    """
+    parts = [_describe(v, [] if pinned is None else pinned) for v in (fn, *args)]
+    key = hashlib.sha1("|".join(text for text, _ in parts).encode()).hexdigest()[:16]
+    return key, all(stable for _, stable in parts)
+
+
+class FitnessCache:
+    def __init__(self, maxsize=4096, path=None, namespace=""):
+        """
+        Args:
+            maxsize: Maximum number of entries kept in memory (LRU eviction).
+                     None means unbounded.
+            path: Optional shelve file for a persistent on-disk store.
+            namespace: Prefix for persistent keys, so one file can hold
+                       several problems without collisions. Required with
+                       path for problems keyed by identity (see above).
+        """
+        self.maxsize = maxsize
+        self.namespace = namespace
+        self._entries = OrderedDict()
+        self._store = shelve.open(path) if path is not None else None
+        self._last_problem = (None, None, None)  # (fn, args, key) of the previous call
+        self._unstable = set()  # problem keys containing object ids
+        self._pinned = []  # objects whose ids appear in problem keys
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _problem_key(self, fn, args):
+        # Evaluators call get() with the same objects for a whole run: reuse the fingerprint
+        last_fn, last_args, key = self._last_problem
+        if fn is not last_fn or len(args) != len(last_args) or any(a is not b for a, b in zip(args, last_args)):
+            key, stable = problem_key(fn, args, self._pinned)
+            if not stable:
+                if self._store is not None and not self.namespace:
+                    raise ValueError(f"cannot fingerprint {fn!r} or its arguments across runs; "
+                                     "pass namespace= to name this problem in the persistent store")
+                self._unstable.add(key)
+            self._last_problem = (fn, args, key)
+        return key
+
+    def _disk_key(self, key):
+        problem, chromosome = key
+        if problem in self._unstable:  # ids differ between runs: the namespace names the problem
+            return f"{self.namespace}:{chromosome!r}"
+        return f"{self.namespace}:{problem}:{chromosome!r}"
+
+    def get(self, chromosome, fn, *args):
+        """Return fn(chromosome, *args), evaluating it only on a cache miss."""
+        key = (self._problem_key(fn, args), chromosome)
+        try:
+            value = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+        if self._store is not None:
+            disk_key = self._disk_key(key)
+            if disk_key in self._store:
+                value = self._store[disk_key]
+                self.hits += 1
+                self.disk_hits += 1
+                self._remember(key, value)
+                return value
+
+        self.misses += 1
+        value = fn(chromosome, *args)
+        self._remember(key, value)
+        if self._store is not None:
+            self._store[self._disk_key(key)] = value
+        return value
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, chromosome):
+        """True if chromosome is cached in memory for any problem."""
+        return any(key[1] == chromosome for key in self._entries)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "hit_rate": self.hit_rate,
+        }
+
+    def clear(self):
+        """Drop the in-memory entries and reset the counters (disk store is kept)."""
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def close(self):
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,72 +1,261 @@
-import random
 import math
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from bio_inspired.checkpoint import Checkpointer, load_checkpoint, make_checkpointer, rng_state, set_rng_state
+from bio_inspired.instrumentation import make_timer
+from bio_inspired.rng import make_rng, python_random
 
 # Objective function to maximize
 def fitness_function(x):
     return x * math.sin(10 * math.pi * x) + 1.0
 
+# Same objective evaluated on a whole NumPy population at once
+def fitness_function_batch(x):
+    return x * np.sin(10 * np.pi * x) + 1.0
+
 # Gene Expression Algorithm
 class GeneExpressionAlgorithm:
-    def __init__(self, pop_size=30, generations=50, crossover_rate=0.8, mutation_rate=0.1):
+    def __init__(self, pop_size=30, generations=50, crossover_rate=0.8, mutation_rate=0.1, cache=None,
+                 fitness=fitness_function, bounds=(-1, 2), seed=None):
         self.pop_size = pop_size
         self.generations = generations
         self.crossover_rate = crossover_rate
         self.mutation_rate = mutation_rate
-        self.population = [random.uniform(-1, 2) for _ in range(pop_size)]  # genetic sequences
+        self.cache = cache  # optional fitness_cache.FitnessCache
+        self.fitness = fitness
+        self.rng = python_random(seed)  # int, SeedSequence, Generator or random.Random
+        self.population = [self.rng.uniform(*bounds) for _ in range(pop_size)]  # genetic sequences
+
+    def evaluate(self, gene):
+        if self.cache is None:
+            return self.fitness(gene)
+        return self.cache.get(gene, self.fitness)
 
     def selection(self):
         # Tournament selection
-        a, b = random.sample(self.population, 2)
-        return a if fitness_function(a) > fitness_function(b) else b
+        a, b = self.rng.sample(self.population, 2)
+        return a if self.evaluate(a) > self.evaluate(b) else b
 
     def crossover(self, parent1, parent2):
-        if random.random() < self.crossover_rate:
-            alpha = random.random()
+        if self.rng.random() < self.crossover_rate:
+            alpha = self.rng.random()
             return alpha * parent1 + (1 - alpha) * parent2
         return parent1
 
     def mutate(self, gene):
-        if random.random() < self.mutation_rate:
-            return gene + random.uniform(-0.1, 0.1)  # small random change
+        if self.rng.random() < self.mutation_rate:
+            return gene + self.rng.uniform(-0.1, 0.1)  # small random change
         return gene
 
-    def run(self):
+    def run(self, verbose=True, observer=None, checkpoint=None, resume_from=None):
+        # checkpoint / resume_from: see bio_inspired.checkpoint
+        timer = make_timer(observer, "gea")
+        checkpointer = make_checkpointer(checkpoint)
         best_solution = None
         best_fitness = float('-inf')
+        start = 0
+        if resume_from is not None:
+            state = load_checkpoint(resume_from, "gea")
+            self.population = state["population"].tolist()
+            best_solution, best_fitness = state["best_solution"], state["best_fitness"]
+            start = state["generation"]
+            set_rng_state(self.rng, state["rng"])
 
-        for gen in range(self.generations):
+        for gen in range(start, self.generations):
+            timer.iteration_start(gen)
             new_population = []
             for _ in range(self.pop_size):
                 # Selection
-                parent1 = self.selection()
-                parent2 = self.selection()
+                with timer.phase("select"):
+                    parent1 = self.selection()
+                    parent2 = self.selection()
 
-                # Crossover
-                offspring = self.crossover(parent1, parent2)
-
-                # Mutation
-                offspring = self.mutate(offspring)
+                # Crossover + Mutation
+                with timer.phase("update"):
+                    offspring = self.mutate(self.crossover(parent1, parent2))
 
                 new_population.append(offspring)
 
                 # Track best solution
-                fit = fitness_function(offspring)
+                with timer.phase("evaluate"):
+                    fit = self.evaluate(offspring)
                 if fit > best_fitness:
                     best_fitness = fit
                     best_solution = offspring
 
             self.population = new_population
-            print(f"Generation {gen+1}: Best Fitness = {best_fitness:.5f}, Best Solution = {best_solution:.5f}")
+            timer.iteration_end(gen, best_fitness)
+            if verbose:
+                print(f"Generation {gen+1}: Best Fitness = {best_fitness:.5f}, Best Solution = {best_solution:.5f}")
+
+            checkpointer.maybe_save(gen + 1, lambda: {
+                "algorithm": "gea",
+                "generation": gen + 1,
+                "population": np.array(self.population, dtype=np.float64),
+                "best_solution": float(best_solution),
+                "best_fitness": float(best_fitness),
+                "rng": rng_state(self.rng),
+            })
 
+        timer.close()
+        checkpointer.close()
         return best_solution, best_fitness
 
 
+# NumPy-backed Gene Expression Algorithm
+class VectorizedGeneExpressionAlgorithm:
+    """
+    Population-at-once variant of GeneExpressionAlgorithm.
+
+    The population lives in a NumPy array and is evaluated exactly once per
+    generation into a cached fitness array; tournaments, blend crossover and
+    mutation are batched index/mask operations, so population sizes of
+    1e5-1e6 are practical.
+
+    With dim=None each individual is a scalar gene (shape (pop_size,)), as in
+    GeneExpressionAlgorithm; with dim=d it is a d-vector (shape (pop_size, d))
+    and fitness_batch must map (pop_size, d) -> (pop_size,). Mutation adds
+    uniform noise in +-mutation_step to each gene with probability mutation_rate.
+    """
+    def __init__(self, pop_size=30, generations=50, crossover_rate=0.8, mutation_rate=0.1,
+                 fitness_batch=fitness_function_batch, seed=None,
+                 bounds=(-1, 2), dim=None, mutation_step=0.1, clip=False):
+        self.pop_size = pop_size
+        self.generations = generations
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.fitness_batch = fitness_batch
+        self.bounds = bounds
+        self.shape = (pop_size,) if dim is None else (pop_size, dim)
+        self.mutation_step = mutation_step
+        self.clip = clip
+        self.rng = make_rng(seed)
+        self.population = self.rng.uniform(bounds[0], bounds[1], self.shape)  # genetic sequences
+        self.fitness = self.fitness_batch(self.population)
+        self.evaluations = pop_size
+
+    def selection(self):
+        # Binary tournament for every slot: two distinct contestants each
+        n = self.pop_size
+        a = self.rng.integers(0, n, n)
+        b = (a + self.rng.integers(1, n, n)) % n
+        return np.where(self.fitness[a] > self.fitness[b], a, b)
+
+    def crossover(self, parent1, parent2):
+        # One alpha / crossover decision per individual, broadcast over its genes
+        per_individual = (self.pop_size,) + (1,) * (len(self.shape) - 1)
+        alpha = self.rng.random(per_individual)
+        blend = alpha * parent1 + (1 - alpha) * parent2
+        mask = self.rng.random(per_individual) < self.crossover_rate
+        return np.where(mask, blend, parent1)
+
+    def mutate(self, genes):
+        mask = self.rng.random(self.shape) < self.mutation_rate
+        genes = genes + mask * self.rng.uniform(-self.mutation_step, self.mutation_step, self.shape)  # small random change
+        if self.clip:
+            genes = np.clip(genes, self.bounds[0], self.bounds[1])
+        return genes
+
+    def run(self, verbose=True, observer=None, checkpoint=None, resume_from=None):
+        # checkpoint / resume_from: see bio_inspired.checkpoint
+        timer = make_timer(observer, "gea")
+        checkpointer = make_checkpointer(checkpoint)
+        start = 0
+        if resume_from is None:
+            best_index = int(np.argmax(self.fitness))
+            best_solution = self.population[best_index].copy()
+            best_fitness = float(self.fitness[best_index])
+        else:
+            state = load_checkpoint(resume_from, "gea_vectorized")
+            self.population, self.fitness = state["population"], state["fitness"]
+            best_solution, best_fitness = np.asarray(state["best_solution"]), state["best_fitness"]
+            self.evaluations = state["evaluations"]
+            start = state["generation"]
+            set_rng_state(self.rng, state["rng"])
+
+        for gen in range(start, self.generations):
+            timer.iteration_start(gen)
+            # Selection
+            with timer.phase("select"):
+                parent1 = self.population[self.selection()]
+                parent2 = self.population[self.selection()]
+
+            # Crossover + Mutation
+            with timer.phase("update"):
+                offspring = self.mutate(self.crossover(parent1, parent2))
+
+            # Single evaluation of the new generation, cached for the next tournaments
+            with timer.phase("evaluate"):
+                self.population = offspring
+                self.fitness = self.fitness_batch(offspring)
+            self.evaluations += self.pop_size
+
+            # Track best solution
+            best_index = int(np.argmax(self.fitness))
+            if self.fitness[best_index] > best_fitness:
+                best_fitness = float(self.fitness[best_index])
+                best_solution = self.population[best_index].copy()
+
+            if verbose:
+                shown = f"{float(best_solution):.5f}" if best_solution.ndim == 0 else best_solution
+                print(f"Generation {gen+1}: Best Fitness = {best_fitness:.5f}, Best Solution = {shown}")
+            timer.iteration_end(gen, best_fitness)
+
+            # population and fitness are replaced (never modified in place) each generation
+            checkpointer.maybe_save(gen + 1, lambda: {
+                "algorithm": "gea_vectorized",
+                "generation": gen + 1,
+                "population": self.population,
+                "fitness": self.fitness,
+                # an array even in scalar mode (0-d), so it is restored as one
+                "best_solution": np.asarray(best_solution),
+                "best_fitness": best_fitness,
+                "evaluations": self.evaluations,
+                "rng": rng_state(self.rng),
+            })
+
+        timer.close()
+        checkpointer.close()
+        return (float(best_solution) if best_solution.ndim == 0 else best_solution), best_fitness
+
+
+def check_resume(dim=None, generations=20, every=5, seed=0):
+    """
+    Round trip of VectorizedGeneExpressionAlgorithm checkpoints: a run
+    resumed from its generation-`every` checkpoint must end exactly like an
+    uninterrupted run. dim=None checks scalar mode.
+    """
+    def make():
+        return VectorizedGeneExpressionAlgorithm(generations=generations, seed=seed, dim=dim,
+                                                 fitness_batch=fitness_function_batch if dim is None
+                                                 else lambda X: fitness_function_batch(X).sum(axis=1))
+
+    full = make().run(verbose=False)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gea.npz")
+        # Interrupted run: stop after the first checkpoint, then resume in a fresh engine
+        interrupted = make()
+        interrupted.generations = every
+        interrupted.run(verbose=False, checkpoint=Checkpointer(path, every=every))
+        resumed = make().run(verbose=False, resume_from=path)
+    assert np.array_equal(full[0], resumed[0]) and full[1] == resumed[1], (full, resumed)
+    return resumed
+
+
 # Run GEA
-gea = GeneExpressionAlgorithm(pop_size=30, generations=30)
-best_sol, best_fit = gea.run()
+if __name__ == "__main__" and "--check-resume" in sys.argv:
+    for dim in (None, 3):
+        print(f"dim={dim}: resumed run matches the uninterrupted run: {check_resume(dim)}")
+elif __name__ == "__main__":
+    gea = GeneExpressionAlgorithm(pop_size=30, generations=30)
+    best_sol, best_fit = gea.run()
 
-print("\nFinal Best Solution:", best_sol)
-print("Final Best Fitness:", best_fit)
+    print("\nFinal Best Solution:", best_sol)
+    print("Final Best Fitness:", best_fit)
 
 
 
@@ -19,6 +19,20 @@ number of generations or until convergence criteria are met.
 generations.
 """
 import math
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+
+import numpy as np
+
+import bitwise_chromosome
+import selection_operators
+from fitness_cache import FitnessCache
+from bio_inspired.checkpoint import load_checkpoint, make_checkpointer, rng_state, set_rng_state
+from bio_inspired.instrumentation import make_timer
+from bio_inspired.rng import make_rng
 
 def binary_to_int(bin_str):
     return int(bin_str, 2)
@@ -26,6 +40,9 @@ def binary_to_int(bin_str):
 def fitness(x):
     return x ** 2  # You can replace this with a DNA-specific fitness later
 
+def chromosome_fitness(chrom, fitness_fn=fitness):
+    return fitness_fn(binary_to_int(chrom))
+
 def print_table(population, fitness_values, prob_values, expected_output, actual_count):
     print(f"{'DNA Seq No':<10} | {'DNA Sequence (bin)':<18} | {'x Value':<7} | {'Fitness (DNA match)':<20} | {'% Prob':<7} | {'Expected Count':<15} | {'Actual Count':<12}")
     print("-"*105)
@@ -34,9 +51,11 @@ def print_table(population, fitness_values, prob_values, expected_output, actual
                                                             fitness_values, prob_values, expected_output, actual_count)):
         print(f"{i:<10} | {chrom:<18} | {x:<7} | {fit:<20} | {prob*100:<7.2f} | {exp:<15.2f} | {act:<12}")
 
-def selection(population):
-    x_values = [binary_to_int(ch) for ch in population]
-    fitness_values = [fitness(x) for x in x_values]
+def selection(population, cache=None, verbose=True, fitness_fn=fitness):
+    if cache is None:
+        fitness_values = [chromosome_fitness(ch, fitness_fn) for ch in population]
+    else:
+        fitness_values = [cache.get(ch, chromosome_fitness, fitness_fn) for ch in population]
     
     total_fitness = sum(fitness_values)
     max_fitness = max(fitness_values)
@@ -51,9 +70,10 @@ def selection(population):
     # Actual count: closest integer to expected output (standard rounding)
     actual_count = [round(val) for val in expected_output]
     
-    print("\nDNA Matching Table:")
-    print_table(population, fitness_values, prob_values, expected_output, actual_count)
-    print(f"\nSum of Fitness (DNA matches): {total_fitness}, Max Fitness: {max_fitness}, Avg Fitness: {avg_fitness:.2f}")
+    if verbose:
+        print("\nDNA Matching Table:")
+        print_table(population, fitness_values, prob_values, expected_output, actual_count)
+        print(f"\nSum of Fitness (DNA matches): {total_fitness}, Max Fitness: {max_fitness}, Avg Fitness: {avg_fitness:.2f}")
     return prob_values, expected_output, actual_count, max_fitness
 
 def print_mating_pool(pool, title):
@@ -63,10 +83,11 @@ def print_mating_pool(pool, title):
     for i, chrom in enumerate(pool):
         print(f"{i:<10} | {chrom:<18}")
 
-def mating_pool_selection(population, pool_size, bit_pos):
+def mating_pool_selection(population, pool_size, bit_pos, verbose=True):
     mating_pool = population[:pool_size]
     
-    print_mating_pool(mating_pool, f"Mating Pool before crossover at bit {bit_pos} (DNA sequence bits)")
+    if verbose:
+        print_mating_pool(mating_pool, f"Mating Pool before crossover at bit {bit_pos} (DNA sequence bits)")
     
     for i in range(0, pool_size-1, 2):
         chrom1 = list(mating_pool[i])
@@ -80,16 +101,18 @@ def mating_pool_selection(population, pool_size, bit_pos):
         mating_pool[i] = "".join(chrom1)
         mating_pool[i+1] = "".join(chrom2)
     
-    print_mating_pool(mating_pool, f"Mating Pool after crossover at bit {bit_pos} (DNA sequence bits)")
+    if verbose:
+        print_mating_pool(mating_pool, f"Mating Pool after crossover at bit {bit_pos} (DNA sequence bits)")
     
     new_population = population.copy()
     new_population[:pool_size] = mating_pool
     return new_population
 
-def mutation(population, mutation_masks):
-    print(f"\nMutation masks applied to DNA sequences:")
-    for i, mask in enumerate(mutation_masks):
-        print(f"DNA Chromosome {i}: {mask}")
+def mutation(population, mutation_masks, verbose=True):
+    if verbose:
+        print(f"\nMutation masks applied to DNA sequences:")
+        for i, mask in enumerate(mutation_masks):
+            print(f"DNA Chromosome {i}: {mask}")
     
     new_population = []
     for chrom, mutation_value in zip(population, mutation_masks):
@@ -101,9 +124,131 @@ def mutation(population, mutation_masks):
                 chrom_list[i] = '1' if chrom_list[i] == '0' else '0'
         new_population.append("".join(chrom_list))
     
-    print(f"Population of DNA sequences after mutation: {new_population}")
+    if verbose:
+        print(f"Population of DNA sequences after mutation: {new_population}")
     return new_population
 
+def run_ga(population, generations=100, pool_size=None, mutation_rate=0.05,
+           seed=None, report_every=None, cache=None, stop_on_stable=False,
+           selector="roulette", fitness_fn=fitness, observer=None, checkpoint=None, resume_from=None):
+    """
+    Non-interactive driver with the same semantics as main(): evaluate,
+    swap one bit across the pairs of the mating pool, apply mutation masks.
+
+    The population is held as a uint64 array (see bitwise_chromosome), so
+    crossover and mutation are single XOR/AND operations and x is the
+    chromosome itself. Crossover bit positions and mutation masks come from a
+    seeded RNG instead of input(); tables are printed only every report_every
+    generations (never when None). With stop_on_stable the run ends as soon
+    as the max fitness stops changing, like main().
+
+    selector ("roulette", "sus", "tournament" or a callable from
+    selection_operators) resamples the population from its fitness before
+    crossover; None keeps main()'s behaviour of mating the first pool_size
+    chromosomes as they are.
+
+    observer: see bio_inspired.instrumentation (phases evaluate, select, update).
+    checkpoint / resume_from: see bio_inspired.checkpoint; a resumed run needs
+    the same arguments and continues exactly where the checkpoint was taken.
+
+    Returns (best_chromosome, best_fitness, max_fitness_history).
+    """
+    timer = make_timer(observer, "ga")
+    checkpointer = make_checkpointer(checkpoint)
+    rng = make_rng(seed)
+    select = selection_operators.get_selector(selector) if selector is not None else None
+    length_chromosome = len(population[0])
+    population = bitwise_chromosome.from_strings(population)
+    if pool_size is None:
+        pool_size = len(population) - len(population) % 2
+
+    best_chrom, best_fitness = None, float("-inf")
+    history = []
+    start = 1
+    if resume_from is not None:
+        state = load_checkpoint(resume_from, "ga")
+        population = state["population"]
+        best_chrom, best_fitness = np.uint64(state["best_chromosome"]), state["best_fitness"]
+        history = state["history"]
+        start = state["generation"] + 1
+        set_rng_state(rng, state["rng"])
+
+    for gen in range(start, generations + 1):
+        timer.iteration_start(gen - 1)
+        report = report_every is not None and gen % report_every == 0
+        if report:
+            print(f"\n=== Generation {gen} ===")
+            selection(bitwise_chromosome.to_strings(population, length_chromosome), verbose=True,
+                      fitness_fn=fitness_fn)
+
+        with timer.phase("evaluate"):
+            if cache is None:
+                fitness_values = [fitness_fn(int(x)) for x in population]
+            else:
+                fitness_values = [cache.get(int(x), fitness_fn) for x in population]
+        best_index = max(range(len(fitness_values)), key=fitness_values.__getitem__)
+        max_fitness = fitness_values[best_index]
+        if max_fitness > best_fitness:
+            best_fitness = max_fitness
+            best_chrom = population[best_index]
+        if stop_on_stable and history and abs(max_fitness - history[-1]) < 1e-5:
+            history.append(max_fitness)
+            timer.iteration_end(gen - 1, best_fitness)
+            break
+        history.append(max_fitness)
+
+        if select is not None:
+            with timer.phase("select"):
+                population = population[select(fitness_values, len(population), rng)]
+
+        with timer.phase("update"):
+            bit_pos = int(rng.integers(length_chromosome))
+            population = bitwise_chromosome.swap_bit(population, pool_size, bit_pos, length_chromosome)
+
+            mutation_masks = bitwise_chromosome.random_masks(rng, len(population), length_chromosome, mutation_rate)
+            population = bitwise_chromosome.mutate(population, mutation_masks)
+        if report:
+            print(f"\nCrossover at bit {bit_pos}, mutation masks: "
+                  f"{bitwise_chromosome.to_strings(mutation_masks, length_chromosome)}")
+        timer.iteration_end(gen - 1, best_fitness)
+
+        checkpointer.maybe_save(gen, lambda: {
+            "algorithm": "ga",
+            "generation": gen,
+            "population": population,
+            "best_chromosome": int(best_chrom),
+            "best_fitness": best_fitness,
+            "history": history,
+            "rng": rng_state(rng),
+        })
+
+    timer.close()
+    checkpointer.close()
+    return bitwise_chromosome.to_strings([best_chrom], length_chromosome)[0], best_fitness, history
+
+def benchmark_ga(sizes=((4, 5), (1000, 32)), generations=500, seed=0):
+    """Generations per second of run_ga with and without per-generation reporting.
+
+    sizes is a sequence of (num_chromosomes, length_chromosome). Reported runs
+    write to os.devnull, so this measures formatting cost only; a real
+    terminal is slower still.
+    """
+    rng = random.Random(seed)
+    results = {}
+    for num_chromosomes, length_chromosome in sizes:
+        population = ["".join(rng.choice("01") for _ in range(length_chromosome))
+                      for _ in range(num_chromosomes)]
+        for label, report_every in (("no reporting", None), ("report every gen", 1)):
+            with open(os.devnull, "w") as sink, redirect_stdout(sink):
+                start = time.perf_counter()
+                run_ga(population, generations=generations, seed=seed, report_every=report_every)
+                elapsed = time.perf_counter() - start
+            key = (num_chromosomes, length_chromosome, label)
+            results[key] = generations / elapsed
+            print(f"{num_chromosomes:>6} x {length_chromosome:<3} bits | {label:<18}: "
+                  f"{results[key]:>12.1f} generations/s")
+    return results
+
 def main():
     print("=== DNA Sequence Matching Genetic Algorithm ===")
     num_chromosomes = int(input("Enter number of DNA sequences (chromosomes): "))
@@ -121,12 +266,14 @@ def main():
                 print(f"Invalid input. Enter binary string of length {length_chromosome}.")
     
     max_fitness_old = -1
+    cache = FitnessCache()
     
     while True:
-        prob_values, expected_output, actual_count, max_fitness = selection(population)
+        prob_values, expected_output, actual_count, max_fitness = selection(population, cache)
         
         if max_fitness == max_fitness_old or abs(max_fitness - max_fitness_old) < 1e-5:
             print("\nDNA matching fitness stabilized, stopping evolution.")
+            print(f"Fitness cache: {cache.stats()}")
             break
         
         max_fitness_old = max_fitness
@@ -164,7 +311,10 @@ def main():
         population = mutation(population, mutation_masks)
         
 if __name__ == "__main__":
-    main()
+    if "--benchmark" in sys.argv:
+        benchmark_ga()
+    else:
+        main()
 
 
 
@@ -1,3 +1,8 @@
+import numpy as np
+
+import bitwise_chromosome
+from fitness_cache import FitnessCache
+
 def decode_chromosome(chromosome, bits_per_project=4, num_projects=4):
     allocations = []
     for i in range(num_projects):
@@ -7,24 +12,52 @@ def decode_chromosome(chromosome, bits_per_project=4, num_projects=4):
         allocations.append(int(part, 2))
     return allocations
 
-def fitness(chromosome, project_values, resource_limit):
-    allocations = decode_chromosome(chromosome)
+def repair_allocations(allocations, resource_limit):
+    # Proportional scale-down: floor(a * limit / total) always fits the limit
+    total_resources = sum(allocations)
+    return [a * resource_limit // total_resources for a in allocations]
+
+def fitness(chromosome, project_values, resource_limit, bits_per_project=4, repair=False):
+    allocations = decode_chromosome(chromosome, bits_per_project, len(project_values))
     total_resources = sum(allocations)
     if total_resources > resource_limit:
-        return 0  # Invalid solution if resource limit exceeded
+        if not repair:
+            return 0  # Invalid solution if resource limit exceeded
+        allocations = repair_allocations(allocations, resource_limit)
     value = sum(a * v for a, v in zip(allocations, project_values))
     return value
 
-def print_table(population, fitness_values, prob_values, expected_output, actual_count, project_values):
+def fitness_bits(population, project_values, resource_limit, bits_per_project=4, repair=False):
+    """fitness() for a whole uint64 population (see bitwise_chromosome).
+
+    Fields are decoded with shift-and-mask instead of int(part, 2); with
+    repair, over-limit rows get the same proportional scale-down as
+    repair_allocations.
+    """
+    allocations = bitwise_chromosome.decode_fields(population, bits_per_project, len(project_values))
+    totals = allocations.sum(axis=1, keepdims=True)
+    over = totals[:, 0] > resource_limit
+    if repair:
+        allocations = np.where(over[:, None], allocations * resource_limit // np.maximum(totals, 1), allocations)
+        return allocations @ np.asarray(project_values)
+    return np.where(over, 0, allocations @ np.asarray(project_values))
+
+def print_table(population, fitness_values, prob_values, expected_output, actual_count, project_values, bits_per_project=4):
     print(f"{'Chrom No':<8} | {'Chromosome (bin)':<18} | {'Allocations':<25} | {'Fitness (Value)':<15} | {'% Prob':<7} | {'Expected Count':<15} | {'Actual Count':<12}")
     print("-" * 110)
     for i, (chrom, fit, prob, exp, act) in enumerate(zip(population, fitness_values, prob_values, expected_output, actual_count)):
-        allocations = decode_chromosome(chrom, bits_per_project=4, num_projects=len(project_values))
+        allocations = decode_chromosome(chrom, bits_per_project=bits_per_project, num_projects=len(project_values))
         alloc_str = ", ".join([f"P{idx+1}:{val}" for idx, val in enumerate(allocations)])
         print(f"{i:<8} | {chrom:<18} | {alloc_str:<25} | {fit:<15} | {prob*100:<7.2f} | {exp:<15.2f} | {act:<12}")
 
-def selection(population, project_values, resource_limit):
-    fitness_values = [fitness(ch, project_values, resource_limit) for ch in population]
+def selection(population, project_values, resource_limit, cache=None, bits_per_project=4, repair=True):
+    # repair: score overweight chromosomes on their scaled-down allocations instead of 0
+    if cache is None:
+        fitness_values = [fitness(ch, project_values, resource_limit, bits_per_project, repair) for ch in population]
+    else:
+        # repair is part of the arguments, so it is part of the cache key
+        fitness_values = [cache.get(ch, fitness, project_values, resource_limit, bits_per_project, repair)
+                          for ch in population]
     total_fitness = sum(fitness_values)
     max_fitness = max(fitness_values)
     avg_fitness = total_fitness / len(fitness_values) if fitness_values else 0
@@ -40,7 +73,7 @@ def selection(population, project_values, resource_limit):
     actual_count = [round(val) for val in expected_output]
 
     print("\nResource Allocation Fitness Table:")
-    print_table(population, fitness_values, prob_values, expected_output, actual_count, project_values)
+    print_table(population, fitness_values, prob_values, expected_output, actual_count, project_values, bits_per_project)
     print(f"\nSum of Fitness (Total Value): {total_fitness}, Max Fitness: {max_fitness}, Avg Fitness: {avg_fitness:.2f}")
 
     return prob_values, expected_output, actual_count, max_fitness
@@ -105,12 +138,13 @@ def main():
         "0000111100001111",  # P1=0, P2=15, P3=0, P4=15
         "0000000011110111",  # P1=0, P2=0, P3=15, P4=7
     ]
+    cache = FitnessCache()
 
     for gen in range(1, num_generations + 1):
         print(f"\n\n=== Generation {gen} ===")
         
         # 1. Selection and fitness calculation
-        prob_values, expected_output, actual_count, max_fitness = selection(population, project_values, resource_limit)
+        prob_values, expected_output, actual_count, max_fitness = selection(population, project_values, resource_limit, cache, bits_per_project, repair=True)
 
         # 2. Crossover parameters
         pool_size = 4  # Using full population for mating
@@ -129,6 +163,8 @@ def main():
 
         population = mutation(population, mutation_masks)
 
+    print(f"\nFitness cache: {cache.stats()}")
+
 if __name__ == "__main__":
     main()
 
@@ -1,12 +1,21 @@
 import random
+import sys
+import time
+
+import numpy as np
+
+from bio_inspired.checkpoint import load_checkpoint, make_checkpointer, rng_state, set_rng_state
+from bio_inspired.instrumentation import make_timer
+from bio_inspired.rng import make_rng, python_random
+from bio_inspired.surrogate import make_surrogate
 
 # Objective Function (Sphere Function)
 def fitness_function(position):
     return sum(x**2 for x in position)   # minimize sum of squares
 
 # Generate a random vector within bounds
-def random_vector(dim, lb, ub):
-    return [random.uniform(lb, ub) for _ in range(dim)]
+def random_vector(dim, lb, ub, rng=random):
+    return [rng.uniform(lb, ub) for _ in range(dim)]
 
 # Clip position within search space boundaries
 def clip(position, lb, ub):
@@ -21,54 +30,269 @@ def select_top_three(wolves, fitness):
     return alpha, beta, delta
 
 # Grey Wolf Optimizer
-def GWO(num_wolves=20, max_iter=30, dim=5, lb=-10, ub=10):
-    # Step 1: Initialize population
-    wolves = [random_vector(dim, lb, ub) for _ in range(num_wolves)]
-    fitness = [fitness_function(w) for w in wolves]
+def GWO(num_wolves=20, max_iter=30, dim=5, lb=-10, ub=10,
+        fitness_fn=fitness_function, verbose=True, observer=None,
+        checkpoint=None, resume_from=None, seed=None, backend=None, fitness_batch=None,
+        surrogate=None):
+    # checkpoint / resume_from: see bio_inspired.checkpoint. A resumed run needs
+    # the same arguments and continues exactly where the checkpoint was taken.
+    # seed: int, SeedSequence, Generator or random.Random (see bio_inspired.rng)
+    # backend: "numba", "numpy", "python" or "auto" runs the array version in
+    # bio_inspired.kernels (fitness_batch: (n, dim) -> (n,) if available,
+    # else fitness_fn per row); None keeps this implementation.
+    # surrogate: None, "rbf", "knn" or a SurrogateScreen (see bio_inspired.surrogate);
+    # each iteration only the wolves it ranks most promising are evaluated
+    # (at least three, so alpha, beta and delta are always evaluated wolves),
+    # the others get +inf and cannot become leaders.
+    screen = make_surrogate(surrogate)
+    if screen is not None and (backend is not None or checkpoint is not None or resume_from is not None):
+        raise ValueError("surrogate needs backend=None and no checkpoint/resume_from")
+    if backend is not None:
+        if checkpoint is not None or resume_from is not None:
+            raise ValueError("checkpoint/resume_from need backend=None")
+        from bio_inspired.kernels import gwo
+        if fitness_batch is None:
+            fitness_batch = lambda X: [fitness_fn(x) for x in X]
+        return gwo(fitness_batch, num_wolves, max_iter, dim, lb, ub,
+                   backend=backend, seed=seed, observer=observer)
+    rng = python_random(seed)
+    timer = make_timer(observer, "gwo")
+    checkpointer = make_checkpointer(checkpoint)
+
+    if resume_from is None:
+        # Step 1: Initialize population
+        wolves = [random_vector(dim, lb, ub, rng) for _ in range(num_wolves)]
+        fitness = [fitness_fn(w) for w in wolves]
+        if screen is not None:
+            screen.observe(wolves, fitness)
+        start = 0
+    else:
+        state = load_checkpoint(resume_from, "gwo")
+        wolves = state["wolves"].tolist()
+        fitness = state["fitness"].tolist()
+        start = state["iteration"]
+        set_rng_state(rng, state["rng"])
 
     # Step 2: Identify Alpha, Beta, Delta
     alpha, beta, delta = select_top_three(wolves, fitness)
 
     # Step 3: Main loop
-    for t in range(max_iter):
+    for t in range(start, max_iter):
+        timer.iteration_start(t)
         a = 2 - (2 * t / max_iter)  # decreases linearly from 2 → 0
 
-        for i in range(num_wolves):
-            new_position = []
-            for d in range(dim):
-                r1, r2 = random.random(), random.random()
-                A = 2 * a * r1 - a
-                C = 2 * r2
+        with timer.phase("update"):
+            for i in range(num_wolves):
+                new_position = []
+                for d in range(dim):
+                    r1, r2 = rng.random(), rng.random()
+                    A = 2 * a * r1 - a
+                    C = 2 * r2
 
-                # Distances
-                D_alpha = abs(C * alpha[d] - wolves[i][d])
-                D_beta  = abs(C * beta[d]  - wolves[i][d])
-                D_delta = abs(C * delta[d] - wolves[i][d])
+                    # Distances
+                    D_alpha = abs(C * alpha[d] - wolves[i][d])
+                    D_beta  = abs(C * beta[d]  - wolves[i][d])
+                    D_delta = abs(C * delta[d] - wolves[i][d])
 
-                # Candidate positions
-                X1 = alpha[d] - A * D_alpha
-                X2 = beta[d]  - A * D_beta
-                X3 = delta[d] - A * D_delta
+                    # Candidate positions
+                    X1 = alpha[d] - A * D_alpha
+                    X2 = beta[d]  - A * D_beta
+                    X3 = delta[d] - A * D_delta
 
-                # New position = average influence
-                new_position.append((X1 + X2 + X3) / 3)
+                    # New position = average influence
+                    new_position.append((X1 + X2 + X3) / 3)
 
-            wolves[i] = clip(new_position, lb, ub)
+                wolves[i] = clip(new_position, lb, ub)
 
         # Update fitness and leaders
-        fitness = [fitness_function(w) for w in wolves]
-        alpha, beta, delta = select_top_three(wolves, fitness)
+        with timer.phase("evaluate"):
+            if screen is None:
+                fitness = [fitness_fn(w) for w in wolves]
+            else:
+                fitness = screen.evaluate(wolves, fitness_fn, min_keep=3)
+        with timer.phase("select"):
+            alpha, beta, delta = select_top_three(wolves, fitness)
+        timer.iteration_end(t, min(fitness))
 
         # Print progress
-        print(f"Iteration {t+1}/{max_iter}, Best Fitness = {fitness_function(alpha):.6f}")
+        if verbose:
+            print(f"Iteration {t+1}/{max_iter}, Best Fitness = {min(fitness):.6f}")
+
+        checkpointer.maybe_save(t + 1, lambda: {
+            "algorithm": "gwo",
+            "iteration": t + 1,
+            "wolves": np.array(wolves),
+            "fitness": np.array(fitness, dtype=np.float64),
+            "rng": rng_state(rng),
+        })
+
+    timer.close()
+    checkpointer.close()
+    return alpha, min(fitness)
+
+# ---------- Adaptive GWO ----------
+def leader_weights(leader_fitness, worst_fitness):
+    """Weights of alpha, beta, delta proportional to how much better than the worst wolf they are."""
+    gains = worst_fitness - np.asarray(leader_fitness, dtype=np.float64)
+    total = gains.sum()
+    if not np.isfinite(total) or total <= 0:
+        return np.full(3, 1 / 3)
+    return gains / total
+
+def GWO_adaptive(num_wolves=20, max_iter=500, dim=30, lb=-10, ub=10,
+                 fitness_fn=fitness_function, fitness_batch=None,
+                 weighted=True, dim_tol=1e-9, stall_iters=50, stall_tol=0.0,
+                 target=None, seed=None, verbose=False, observer=None):
+    """
+    GWO on arrays with three additions, each of which can be switched off:
+
+    weighted    - X1, X2, X3 are combined with leader_weights() instead of
+                  averaged equally (False: plain GWO average)
+    dim_tol     - a dimension whose spread over the pack (max - min) drops
+                  below dim_tol * (ub - lb) is frozen: it is no longer drawn,
+                  updated or clipped (None: never freeze). When every
+                  dimension is frozen the run stops ("converged").
+    stall_iters - stop when the best fitness improved by no more than
+                  stall_tol over the last stall_iters iterations (None: never).
+                  Only checked once a < 1: while |A| can exceed 1 the pack is
+                  exploring and long stretches without improvement are normal.
+
+    With weighted=False, dim_tol=None and stall_iters=None this is the
+    standard GWO update (shared r1, r2 for the three leaders), so the two
+    can be compared on the same seed.
+
+    fitness_batch maps (n, dim) -> (n,); otherwise fitness_fn is called per wolf.
+    target: fitness at which time/evaluations to target are recorded.
+
+    Returns (best_position, best_fitness, info) where info has iterations,
+    evaluations, evaluations_saved (of the max_iter budget), stop_reason,
+    frozen_dims, time_to_target, evaluations_to_target and elapsed.
+    """
+    rng = make_rng(seed)
+    timer = make_timer(observer, "gwo")
+    if fitness_batch is None:
+        fitness_batch = lambda X: [fitness_fn(x) for x in X]
+    start_time = time.perf_counter()
+
+    wolves = rng.uniform(lb, ub, (num_wolves, dim))
+    fitness = np.asarray(fitness_batch(wolves), dtype=np.float64)
+    evaluations = num_wolves
+    best = int(np.argmin(fitness))
+    best_position, best_fitness = wolves[best].copy(), float(fitness[best])
+    history = [best_fitness]
+    time_to_target = evaluations_to_target = None
+    if target is not None and best_fitness <= target:
+        time_to_target, evaluations_to_target = time.perf_counter() - start_time, evaluations
+
+    active = np.arange(dim)
+    freeze_below = None if dim_tol is None else dim_tol * (ub - lb)
+    stop_reason = "max_iter"
+    iterations = 0
+
+    for t in range(max_iter):
+        timer.iteration_start(t)
+        a = 2 - (2 * t / max_iter)  # decreases linearly from 2 -> 0
+        with timer.phase("select"):
+            order = np.argsort(fitness, kind="stable")[:3]
+            weights = leader_weights(fitness[order], fitness.max()) if weighted else np.full(3, 1 / 3)
+
+        with timer.phase("update"):
+            # Plain slices until the first dimension freezes (fancy indexing copies)
+            cols = slice(None) if len(active) == dim else active
+            X = wolves[:, cols]
+            leaders = wolves[order][:, cols]
+            r1 = rng.random(X.shape)
+            r2 = rng.random(X.shape)
+            A = 2 * a * r1 - a
+            C = 2 * r2
+            new_position = sum(w * (leader - A * np.abs(C * leader - X)) for w, leader in zip(weights, leaders))
+            wolves[:, cols] = np.clip(new_position, lb, ub)
+
+        with timer.phase("evaluate"):
+            fitness = np.asarray(fitness_batch(wolves), dtype=np.float64)
+        evaluations += num_wolves
+        iterations = t + 1
+
+        best = int(np.argmin(fitness))
+        if fitness[best] < best_fitness:
+            best_position, best_fitness = wolves[best].copy(), float(fitness[best])
+        history.append(best_fitness)
+        if time_to_target is None and target is not None and best_fitness <= target:
+            time_to_target, evaluations_to_target = time.perf_counter() - start_time, evaluations
+        timer.iteration_end(t, best_fitness)
+
+        if verbose:
+            print(f"Iteration {t+1}/{max_iter}, Best Fitness = {best_fitness:.6f}, Active dims = {len(active)}")
+
+        # Freeze collapsed dimensions, then check the stop criteria
+        if freeze_below is not None:
+            spread = np.ptp(wolves[:, cols], axis=0)
+            active = active[spread >= freeze_below]
+            if not len(active):
+                stop_reason = "converged"
+                break
+        if stall_iters is not None and a < 1 and len(history) > stall_iters \
+                and history[-stall_iters - 1] - best_fitness <= stall_tol:
+            stop_reason = "stall"
+            break
+
+    timer.close()
+    info = {
+        "iterations": iterations,
+        "evaluations": evaluations,
+        "evaluations_saved": num_wolves * (max_iter + 1) - evaluations,
+        "stop_reason": stop_reason,
+        "frozen_dims": dim - len(active),
+        "time_to_target": time_to_target,
+        "evaluations_to_target": evaluations_to_target,
+        "elapsed": time.perf_counter() - start_time,
+    }
+    return best_position, best_fitness, info
+
+def benchmark_adaptive(dims=(30, 100, 300), functions=("sphere", "rastrigin", "ackley"),
+                       num_wolves=30, max_iter=1000, target=1e-6, seed=0):
+    """
+    Standard GWO (same array code with the additions switched off) against
+    GWO_adaptive on the benchmark functions: final error, evaluations used /
+    saved, and time and evaluations to reach `target`.
+    """
+    from bio_inspired.benchmarks import FUNCTIONS
 
-    return alpha, fitness_function(alpha)
+    variants = {
+        "standard": {"weighted": False, "dim_tol": None, "stall_iters": None},
+        "adaptive": {},
+    }
+    print(f"{'Function':<10} | {'Dim':>4} | {'Variant':<8} | {'Best':>10} | {'Evals':>6} | {'Saved':>6} | "
+          f"{'Stop':<9} | {'Evals to target':>15} | {'Time to target (s)':>18}")
+    print("-" * 110)
+    results = {}
+    for name in functions:
+        fn, (lb, ub) = FUNCTIONS[name]
+        for dim in dims:
+            for variant, options in variants.items():
+                _, best, info = GWO_adaptive(num_wolves, max_iter, dim, lb, ub, fitness_batch=fn,
+                                             target=target, seed=seed, **options)
+                results[(name, dim, variant)] = dict(info, best_fitness=best)
+                to_target = "-" if info["time_to_target"] is None else f"{info['time_to_target']:.3f}"
+                print(f"{name:<10} | {dim:>4} | {variant:<8} | {best:>10.3e} | {info['evaluations']:>6} | "
+                      f"{info['evaluations_saved']:>6} | {info['stop_reason']:<9} | "
+                      f"{info['evaluations_to_target'] or '-':>15} | {to_target:>18}")
+            standard, adaptive = results[(name, dim, "standard")], results[(name, dim, "adaptive")]
+            line = (f"{'':<10} | {dim:>4} | evaluations saved {adaptive['evaluations_saved'] / standard['evaluations']:.0%}, "
+                    f"run time x{standard['elapsed'] / adaptive['elapsed']:.2f}")
+            if standard["time_to_target"] and adaptive["time_to_target"]:
+                line += f", time to target x{standard['time_to_target'] / adaptive['time_to_target']:.2f}"
+            print(line)
+    return results
 
 # Run GWO
-best_position, best_value = GWO()
-print("\nBest Solution Found:")
-print("Position:", best_position)
-print("Fitness:", best_value)
+if __name__ == "__main__" and "--benchmark" in sys.argv:
+    benchmark_adaptive()
+elif __name__ == "__main__":
+    best_position, best_value = GWO()
+    print("\nBest Solution Found:")
+    print("Position:", best_position)
+    print("Fitness:", best_value)
 
 
 '''
@@ -0,0 +1,245 @@
+"""
+Island-model GA: many sub-populations evolved in a process pool.
+
+Each island is evolved for `migration_interval` generations by a worker
+process using the existing operators (bitwise_chromosome crossover/mutation
+and selection_operators for bit-string problems, ResourceAllocationGA for
+resource-allocation problems). Between epochs the best `migrants` of every
+island replace the worst of its neighbours on a ring or fully connected
+topology.
+
+Island populations and fitness live in multiprocessing.shared_memory arrays;
+workers attach to them once in the pool initializer and evolve their island
+in place, so populations are never pickled.
+
+Example:
+    problem = ResourceAllocationProblem(values, resource_limit=2000)
+    result = run_islands(problem, num_islands=8, island_size=200, epochs=20)
+    print(result["best_fitness"], result["evaluations_per_sec"])
+
+    python island_model.py      # throughput scaling up to os.cpu_count()
+"""
+import os
+import time
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+import bitwise_chromosome
+import genetic_algorithm
+import selection_operators
+from bio_inspired.rng import child_seed, make_rng, seed_sequence
+from resource_allocation import ResourceAllocationGA, ResourceAllocationProblem
+
+
+class BitStringProblem:
+    """The genetic_algorithm.py problem: maximize fitness(x) over length-bit x."""
+
+    num_words = 1
+
+    def __init__(self, length, fitness=genetic_algorithm.fitness):
+        bitwise_chromosome._check_length(length)
+        self.length = length
+        self.fitness = fitness  # must be picklable (module-level) and accept arrays
+
+    def evaluate(self, population):
+        """Returns (fitness, x) like ResourceAllocationProblem.evaluate."""
+        x = population[:, 0].astype(np.float64)
+        return np.asarray(self.fitness(x), dtype=np.float64), x
+
+    def random_population(self, rng, pop_size):
+        return bitwise_chromosome.random_masks(rng, pop_size, self.length, 0.5)[:, None]
+
+    def to_strings(self, population):
+        return bitwise_chromosome.to_strings(population[:, 0], self.length)
+
+
+class BitStringGA:
+    """run_ga's generation loop (select, swap one bit, mask mutation) on one island."""
+
+    def __init__(self, problem, population, mutation_rate=0.05, selector="roulette", seed=None, fitness=None):
+        self.problem = problem
+        self.rng = make_rng(seed)
+        self.mutation_rate = mutation_rate
+        self.select = selection_operators.get_selector(selector)
+        self.population = np.array(population[:, 0], dtype=np.uint64)
+        if fitness is not None:
+            # Scores carried over from the previous epoch
+            self.fitness = np.array(fitness, dtype=np.float64)
+            self.evaluations = 0
+        else:
+            self.fitness = problem.evaluate(self.population[:, None])[0]
+            self.evaluations = len(self.population)
+
+    def run(self, generations):
+        length = self.problem.length
+        n = len(self.population)
+        for _ in range(generations):
+            # Keep the best chromosome so migrants are not lost to mutation
+            best = self.population[np.argmax(self.fitness)]
+            population = self.population[self.select(self.fitness, n, self.rng)]
+            population = bitwise_chromosome.swap_bit(population, n, int(self.rng.integers(length)), length)
+            masks = bitwise_chromosome.random_masks(self.rng, n, length, self.mutation_rate)
+            population = bitwise_chromosome.mutate(population, masks)
+            population[0] = best
+            self.population = population
+            self.fitness = self.problem.evaluate(population[:, None])[0]
+            self.evaluations += n
+
+
+def _make_engine(problem, population, fitness, params, seed):
+    # The island's fitness row is kept up to date by the previous epoch and
+    # migrate(), so the engines start from it instead of re-scoring the island
+    if isinstance(problem, ResourceAllocationProblem):
+        return ResourceAllocationGA(problem, population=population, fitness=fitness, seed=seed, **params)
+    return BitStringGA(problem, population, seed=seed, fitness=fitness, **params)
+
+
+# ---------- Worker side ----------
+_worker = {}
+
+
+def _attach(pop_name, fit_name, pop_shape, problem, params, seed):
+    pop_shm = shared_memory.SharedMemory(name=pop_name)
+    fit_shm = shared_memory.SharedMemory(name=fit_name)
+    _worker.update(
+        pop_shm=pop_shm,
+        fit_shm=fit_shm,
+        population=np.ndarray(pop_shape, dtype=np.uint64, buffer=pop_shm.buf),
+        fitness=np.ndarray(pop_shape[:2], dtype=np.float64, buffer=fit_shm.buf),
+        problem=problem,
+        params=params,
+        seed=seed,
+    )
+
+
+def _evolve_island(task):
+    island, epoch, generations = task
+    population = _worker["population"][island]
+    # Stream (island, epoch) of the run's spawn tree: independent of the worker it lands on
+    seed = child_seed(_worker["seed"], island, epoch)
+    engine = _make_engine(_worker["problem"], population, _worker["fitness"][island],
+                          _worker["params"], seed)
+    engine.run(generations)
+    population[:] = engine.population.reshape(population.shape)
+    _worker["fitness"][island] = engine.fitness
+    return engine.evaluations
+
+
+# ---------- Migration ----------
+def migrate(population, fitness, migrants, topology="ring"):
+    """Copy the best `migrants` of each island over the worst of its targets, in place.
+
+    ring:            island i sends to island (i + 1) % num_islands
+    fully_connected: every island receives the best `migrants` of all other islands
+    """
+    num_islands = len(population)
+    if num_islands < 2 or migrants <= 0:
+        return
+    order = np.argsort(-fitness, axis=1)
+    best = order[:, :migrants]
+    worst = order[:, ::-1][:, :migrants]
+    rows = np.arange(num_islands)[:, None]
+    best_pop = population[rows, best].copy()
+    best_fit = fitness[rows, best].copy()
+
+    if topology == "ring":
+        source = (np.arange(num_islands) - 1) % num_islands
+        population[rows, worst] = best_pop[source]
+        fitness[rows, worst] = best_fit[source]
+    elif topology == "fully_connected":
+        for i in range(num_islands):
+            others = np.delete(np.arange(num_islands), i)
+            pool_fit = best_fit[others].ravel()
+            pool_pop = best_pop[others].reshape(-1, population.shape[2])
+            top = np.argsort(-pool_fit)[:migrants]
+            population[i, worst[i]] = pool_pop[top]
+            fitness[i, worst[i]] = pool_fit[top]
+    else:
+        raise ValueError(f"Unknown migration topology: {topology!r}")
+
+
+# ---------- Driver ----------
+def run_islands(problem, num_islands=8, island_size=100, epochs=10, migration_interval=10,
+                migrants=2, topology="ring", workers=None, seed=0, verbose=False, **params):
+    """
+    Evolve num_islands populations for epochs * migration_interval generations.
+
+    problem: BitStringProblem or ResourceAllocationProblem.
+    seed:    int, SeedSequence or Generator (see bio_inspired.rng); island i
+             evolves epoch e with the independent child stream (i, e).
+    params:  Extra keyword arguments for the island engine (e.g. mutation_rate).
+
+    Returns a dict with best_chromosome, best_fitness, history (best fitness
+    after each epoch), evaluations, elapsed and evaluations_per_sec.
+    """
+    workers = workers or os.cpu_count()
+    seed = seed_sequence(seed)
+    pop_shape = (num_islands, island_size, problem.num_words)
+    pop_shm = shared_memory.SharedMemory(create=True, size=int(np.prod(pop_shape)) * 8)
+    fit_shm = shared_memory.SharedMemory(create=True, size=num_islands * island_size * 8)
+    try:
+        population = np.ndarray(pop_shape, dtype=np.uint64, buffer=pop_shm.buf)
+        fitness = np.ndarray(pop_shape[:2], dtype=np.float64, buffer=fit_shm.buf)
+        rng = make_rng(seed)
+        for i in range(num_islands):
+            population[i] = problem.random_population(rng, island_size).reshape(island_size, -1)
+            fitness[i] = problem.evaluate(population[i])[0]
+        evaluations = num_islands * island_size
+        history = []
+
+        start = time.perf_counter()
+        with Pool(workers, initializer=_attach,
+                  initargs=(pop_shm.name, fit_shm.name, pop_shape, problem, params, seed)) as pool:
+            for epoch in range(epochs):
+                tasks = [(i, epoch, migration_interval) for i in range(num_islands)]
+                evaluations += sum(pool.map(_evolve_island, tasks))
+                migrate(population, fitness, migrants, topology)
+                history.append(float(fitness.max()))
+                if verbose:
+                    print(f"Epoch {epoch + 1}: Best Fitness = {history[-1]}")
+        elapsed = time.perf_counter() - start
+
+        island, index = np.unravel_index(np.argmax(fitness), fitness.shape)
+        return {
+            "best_chromosome": population[island, index].copy(),
+            "best_fitness": float(fitness[island, index]),
+            "history": history,
+            "evaluations": evaluations,
+            "elapsed": elapsed,
+            "evaluations_per_sec": (evaluations - num_islands * island_size) / elapsed,
+        }
+    finally:
+        pop_shm.close()
+        pop_shm.unlink()
+        fit_shm.close()
+        fit_shm.unlink()
+
+
+def benchmark_scaling(problem=None, num_islands=None, island_size=500, epochs=5,
+                      migration_interval=10, worker_counts=None):
+    """Throughput (evaluations/s) of run_islands for 1..cpu_count workers.
+
+    The number of islands defaults to the core count so every worker has
+    work at every scale; efficiency is throughput / (workers * 1-worker throughput).
+    """
+    cores = os.cpu_count()
+    if problem is None:
+        values = np.random.default_rng(0).uniform(1, 10, 500)
+        problem = ResourceAllocationProblem(values, resource_limit=2000)
+    num_islands = num_islands or cores
+    worker_counts = worker_counts or sorted({1, *range(2, cores + 1, 2), cores})
+
+    results = {}
+    for workers in worker_counts:
+        result = run_islands(problem, num_islands=num_islands, island_size=island_size,
+                             epochs=epochs, migration_interval=migration_interval, workers=workers)
+        results[workers] = result["evaluations_per_sec"]
+        efficiency = results[workers] / (workers * results[worker_counts[0]])
+        print(f"workers={workers:<3} | {results[workers]:>14.0f} evaluations/s | "
+              f"speedup {results[workers] / results[worker_counts[0]]:5.2f} | efficiency {efficiency:5.1%}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_scaling()
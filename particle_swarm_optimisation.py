@@ -3,106 +3,236 @@ PSO implementation to minimize f(x,y) = (x-5)^2 + (y+2)^2
 The global minimum (the "food") is at (5, -2).
 """
 
-import random
 import math
+import time
 import matplotlib.pyplot as plt
+import numpy as np
+
+from bio_inspired.checkpoint import load_checkpoint, make_checkpointer, rng_state, set_rng_state
+from bio_inspired.instrumentation import make_timer
+from bio_inspired.rng import python_random
+from bio_inspired.surrogate import make_surrogate
 
 # --------- Problem (fitness) ----------
-def fitness(position):
-    target_x, target_y = 7.0, -3.0
+target_x, target_y = 7.0, -3.0
 
 def fitness(position):
     x, y = position
     return (x - target_x)**2 + (y + target_y)**2  # careful: +y+3 is same as (y - (-3)
 
+# --------- Inertia schedules ----------
+def inertia_weight(schedule, t, iterations, w, w_max, w_min, success_rate):
+    """Inertia for iteration t (1-based).
+
+    constant - fixed w
+    linear   - decreases linearly from w_max to w_min over the run
+    adaptive - success-rate based: w_min + (w_max - w_min) * fraction of
+               particles that improved their pbest in this iteration
+    """
+    if schedule == "constant":
+        return w
+    if schedule == "linear":
+        return w_max - (w_max - w_min) * t / iterations
+    if schedule == "adaptive":
+        return w_min + (w_max - w_min) * success_rate
+    raise ValueError(f"Unknown inertia schedule: {schedule!r}")
+
+def swarm_diameter(particles):
+    # Diagonal of the axis-aligned bounding box of the swarm: O(n * dim) and
+    # an upper bound of the true (pairwise) diameter.
+    positions = [p["position"] for p in particles]
+    return math.sqrt(sum((max(col) - min(col)) ** 2 for col in zip(*positions)))
+
 # --------- PSO parameters (you can change these) ----------
 def run_pso(num_particles=100, iterations=100,
             w=0.5, c1=1.5, c2=1.5,
             pos_bound=(-20, 20), vel_bound=(-2, 2),
-            show_plots=True, seed=None):
-    if seed is not None:
-        random.seed(seed)
-
-    dim = 2  # x and y
-
-    # Initialize particles
-    particles = []
-    for _ in range(num_particles):
-        pos = [random.uniform(pos_bound[0], pos_bound[1]) for _ in range(dim)]
-        vel = [random.uniform(vel_bound[0], vel_bound[1]) for _ in range(dim)]
-        pbest = pos[:]
-        pbest_f = fitness(pos)
-        particles.append({
-            "position": pos,
-            "velocity": vel,
-            "pbest": pbest,
-            "pbest_f": pbest_f
-        })
-
-    # Global best
-    gbest_particle = min(particles, key=lambda p: p["pbest_f"])
-    gbest_pos = gbest_particle["pbest"][:]
-    gbest_f = gbest_particle["pbest_f"]
+            show_plots=True, seed=None,
+            w_schedule="constant", w_max=0.9, w_min=0.4,
+            fitness_tol=None, stall_iters=None, stall_tol=0.0,
+            min_diameter=None, time_budget=None,
+            fitness_fn=fitness, dim=2, verbose=True, observer=None,
+            checkpoint=None, resume_from=None, surrogate=None):
+    """
+    Minimizes fitness_fn over [pos_bound[0], pos_bound[1]]^dim.
+
+    Stop criteria (all optional, checked once per iteration):
+        fitness_tol  - stop once gbest_f <= fitness_tol
+        stall_iters  - stop when gbest_f improved by no more than stall_tol
+                       over the last stall_iters entries of gbest_history
+        min_diameter - stop when the swarm diameter collapses below this
+        time_budget  - wall-clock budget in seconds
+
+    Returns (gbest_pos, gbest_f, stop_reason, evaluations) where stop_reason
+    is one of "max_iter", "fitness_tol", "stall", "diameter", "time_budget".
+
+    checkpoint / resume_from: see bio_inspired.checkpoint. A resumed run needs
+    the same arguments and continues exactly where the checkpoint was taken
+    (time_budget counts the time already spent; trajectories restart).
+
+    surrogate: None, "rbf", "knn" or a SurrogateScreen (see
+    bio_inspired.surrogate). Each iteration only the particles the model
+    ranks most promising are evaluated; evaluations counts those.
+    """
+    screen = make_surrogate(surrogate)
+    if screen is not None and (checkpoint is not None or resume_from is not None):
+        raise ValueError("checkpoint/resume_from need surrogate=None")
+    rng = python_random(seed)  # int, SeedSequence, Generator or random.Random
+
+    start_time = time.perf_counter()
+    timer = make_timer(observer, "pso")
+    checkpointer = make_checkpointer(checkpoint)
+
+    if resume_from is None:
+        # Initialize particles
+        particles = []
+        for _ in range(num_particles):
+            pos = [rng.uniform(pos_bound[0], pos_bound[1]) for _ in range(dim)]
+            vel = [rng.uniform(vel_bound[0], vel_bound[1]) for _ in range(dim)]
+            pbest = pos[:]
+            pbest_f = fitness_fn(pos)
+            particles.append({
+                "position": pos,
+                "velocity": vel,
+                "pbest": pbest,
+                "pbest_f": pbest_f
+            })
+        evaluations = num_particles
+        if screen is not None:
+            screen.observe([p["position"] for p in particles], [p["pbest_f"] for p in particles])
+
+        # Global best
+        gbest_particle = min(particles, key=lambda p: p["pbest_f"])
+        gbest_pos = gbest_particle["pbest"][:]
+        gbest_f = gbest_particle["pbest_f"]
+
+        # For plotting / analysis
+        gbest_history = [gbest_f]
+        start = 1
+    else:
+        state = load_checkpoint(resume_from, "pso")
+        particles = [{"position": pos, "velocity": vel, "pbest": pbest, "pbest_f": pbest_f}
+                     for pos, vel, pbest, pbest_f in zip(state["position"].tolist(), state["velocity"].tolist(),
+                                                         state["pbest"].tolist(), state["pbest_f"].tolist())]
+        gbest_pos = state["gbest_pos"].tolist()
+        gbest_f = state["gbest_f"]
+        gbest_history = state["gbest_history"]
+        evaluations = state["evaluations"]
+        start_time -= state["elapsed"]
+        start = state["iteration"] + 1
+        set_rng_state(rng, state["rng"])
 
-    # For plotting / analysis
-    gbest_history = [gbest_f]
     # store positions for plotting trajectories (list of lists)
     trajectories = [[p["position"][:]] for p in particles]
 
-    # Main loop
-    for t in range(1, iterations + 1):
-        for i, p in enumerate(particles):
-            # Evaluate current fitness
-            f = fitness(p["position"])
+    stop_reason = "max_iter"
 
-            # Update personal best
-            if f < p["pbest_f"]:
-                p["pbest"] = p["position"][:]
-                p["pbest_f"] = f
-
-            # Update global best
-            if f < gbest_f:
-                gbest_f = f
-                gbest_pos = p["position"][:]
+    # Main loop
+    for t in range(start, iterations + 1):
+        timer.iteration_start(t - 1)
+        successes = 0
+        with timer.phase("evaluate"):
+            # Evaluate current fitness (screened-out particles get +inf)
+            if screen is None:
+                values = [fitness_fn(p["position"]) for p in particles]
+                evaluations += num_particles
+            else:
+                before = screen.true_evaluations
+                values = screen.evaluate([p["position"] for p in particles], fitness_fn)
+                evaluations += screen.true_evaluations - before
+
+            for i, (p, f) in enumerate(zip(particles, values)):
+                # Update personal best
+                if f < p["pbest_f"]:
+                    p["pbest"] = p["position"][:]
+                    p["pbest_f"] = f
+                    successes += 1
+
+                # Update global best
+                if f < gbest_f:
+                    gbest_f = f
+                    gbest_pos = p["position"][:]
 
         # Save global best history
         gbest_history.append(gbest_f)
 
+        # Stop criteria
+        if fitness_tol is not None and gbest_f <= fitness_tol:
+            stop_reason = "fitness_tol"
+        elif (stall_iters is not None and len(gbest_history) > stall_iters
+              and gbest_history[-stall_iters - 1] - gbest_f <= stall_tol):
+            stop_reason = "stall"
+        elif min_diameter is not None and swarm_diameter(particles) < min_diameter:
+            stop_reason = "diameter"
+        elif time_budget is not None and time.perf_counter() - start_time >= time_budget:
+            stop_reason = "time_budget"
+        if stop_reason != "max_iter":
+            timer.iteration_end(t - 1, gbest_f)
+            if verbose:
+                print(f"Iter {t:3d} | stopping early ({stop_reason}) | best fitness = {gbest_f:.3e}")
+            break
+
+        w_t = inertia_weight(w_schedule, t, iterations, w, w_max, w_min,
+                             successes / num_particles)
+
         # Update velocity and position
-        for i, p in enumerate(particles):
-            new_vel = []
-            new_pos = []
-            for d in range(dim):
-                r1 = random.random()
-                r2 = random.random()
-                cognitive = c1 * r1 * (p["pbest"][d] - p["position"][d])
-                social = c2 * r2 * (gbest_pos[d] - p["position"][d])
-                v_new = w * p["velocity"][d] + cognitive + social
+        with timer.phase("update"):
+            for i, p in enumerate(particles):
+                new_vel = []
+                new_pos = []
+                for d in range(dim):
+                    r1 = rng.random()
+                    r2 = rng.random()
+                    cognitive = c1 * r1 * (p["pbest"][d] - p["position"][d])
+                    social = c2 * r2 * (gbest_pos[d] - p["position"][d])
+                    v_new = w_t * p["velocity"][d] + cognitive + social
 
-                # clamp velocity
-                v_new = max(vel_bound[0], min(vel_bound[1], v_new))
-                x_new = p["position"][d] + v_new
+                    # clamp velocity
+                    v_new = max(vel_bound[0], min(vel_bound[1], v_new))
+                    x_new = p["position"][d] + v_new
 
-                # Optionally clamp position to search bounds
-                x_new = max(pos_bound[0], min(pos_bound[1], x_new))
+                    # Optionally clamp position to search bounds
+                    x_new = max(pos_bound[0], min(pos_bound[1], x_new))
 
-                new_vel.append(v_new)
-                new_pos.append(x_new)
+                    new_vel.append(v_new)
+                    new_pos.append(x_new)
 
-            p["velocity"] = new_vel
-            p["position"] = new_pos
+                p["velocity"] = new_vel
+                p["position"] = new_pos
 
-            # record for trajectory plot
-            trajectories[i].append(p["position"][:])
+                # record for trajectory plot
+                trajectories[i].append(p["position"][:])
 
         # Optional: print progress every 10 or at last iteration
-        if t % max(1, iterations // 10) == 0 or t == iterations:
+        if verbose and (t % max(1, iterations // 10) == 0 or t == iterations):
             print(f"Iter {t:3d} | gbest = {gbest_pos} | best fitness = {gbest_f:.3e}")
+        timer.iteration_end(t - 1, gbest_f)  # 0-based, like the other algorithms
+
+        checkpointer.maybe_save(t, lambda: {
+            "algorithm": "pso",
+            "iteration": t,
+            "position": np.array([p["position"] for p in particles]),
+            "velocity": np.array([p["velocity"] for p in particles]),
+            "pbest": np.array([p["pbest"] for p in particles]),
+            "pbest_f": np.array([p["pbest_f"] for p in particles], dtype=np.float64),
+            "gbest_pos": np.array(gbest_pos),
+            "gbest_f": float(gbest_f),
+            "gbest_history": [float(f) for f in gbest_history],
+            "evaluations": evaluations,
+            "elapsed": time.perf_counter() - start_time,
+            "rng": rng_state(rng),
+        })
+
+    timer.close()
+    checkpointer.close()
 
     # Final result
-    print("\nFINAL RESULT")
-    print("Best position found:", gbest_pos)
-    print("Best fitness value:", gbest_f)
+    if verbose:
+        print("\nFINAL RESULT")
+        print("Best position found:", gbest_pos)
+        print("Best fitness value:", gbest_f)
+        print("Stop reason:", stop_reason)
+        print("Evaluations used:", evaluations)
 
     # Plots
     if show_plots:
@@ -123,7 +253,7 @@ def run_pso(num_particles=100, iterations=100,
         ax[0].grid(True)
         
 
-    return gbest_pos, gbest_f
+    return gbest_pos, gbest_f, stop_reason, evaluations
 
 # ----------------- If run as script -----------------
 if __name__ == "__main__":
@@ -134,7 +264,9 @@ if __name__ == "__main__":
         N, I = 100, 100
 
     # run PSO (seed for reproducibility if needed)
-    best_pos, best_val = run_pso(num_particles=N, iterations=I, seed=42)
+    best_pos, best_val, stop_reason, evaluations = run_pso(
+        num_particles=N, iterations=I, seed=42,
+        w_schedule="linear", stall_iters=20, stall_tol=1e-12)
 
 
 
@@ -0,0 +1,295 @@
+"""
+Scalable resource-allocation GA.
+
+genetic_algorithm_application_resource.py evolves a fixed 4-project x 4-bit
+portfolio one chromosome string at a time. Here the project count, bits per
+project, project values and resource limit are problem parameters, the
+population is a (pop_size, num_words) uint64 matrix (see bitwise_chromosome)
+and decoding + scoring of the whole population is one vectorized operation,
+so thousands of projects and large populations are practical.
+
+Several resource dimensions (budget, headcount, machine hours, ...) are
+supported through a per-project cost matrix. Instead of scoring over-limit
+portfolios as 0, the GA repairs them by scaling every allocation down by the
+tightest limit/usage ratio, and keeps per-chromosome resource usage up to
+date incrementally after mutation (only the mutated projects are re-costed;
+with fractional costs the mutated chromosomes are re-costed in full, since
+incremental float sums could drift across a limit).
+
+Example:
+    problem = ResourceAllocationProblem(project_values, resource_limit=2000)
+    # or, with several resources:
+    problem = ResourceAllocationProblem(project_values, resource_limit=[budget, headcount],
+                                        costs=[budget_per_unit, staff_per_unit])
+    ga = ResourceAllocationGA(problem, pop_size=500, seed=0)
+    best_allocations, best_value, history = ga.run(generations=200)
+"""
+import numpy as np
+
+import bitwise_chromosome
+import selection_operators
+from bio_inspired.checkpoint import load_checkpoint, make_checkpointer, rng_state, set_rng_state
+from bio_inspired.rng import make_rng
+
+
+class ResourceAllocationProblem:
+    def __init__(self, project_values, resource_limit, bits_per_project=4, costs=None):
+        """
+        Args:
+            project_values: Value per allocated unit, one per project.
+            resource_limit: Limit of the single resource, or one limit per
+                            row of costs.
+            costs: Optional (num_resources, num_projects) cost per allocated
+                   unit. Default: one resource costing 1 per unit, as in
+                   genetic_algorithm_application_resource.py.
+        """
+        self.project_values = np.asarray(project_values, dtype=np.float64)
+        self.num_projects = len(self.project_values)
+        if costs is None:
+            costs = np.ones((1, self.num_projects))
+        self.costs = np.atleast_2d(np.asarray(costs, dtype=np.float64))
+        self.limits = np.broadcast_to(np.asarray(resource_limit, dtype=np.float64),
+                                      (len(self.costs),)).copy()
+        if self.costs.shape[1] != self.num_projects:
+            raise ValueError("costs must have one column per project.")
+        if (self.costs < 0).any():
+            raise ValueError("costs must be non-negative.")
+        # Integer-valued costs keep incremental usage updates exact
+        self.integer_costs = bool((self.costs == np.round(self.costs)).all())
+        self.resource_limit = resource_limit
+        self.bits_per_project = bits_per_project
+        self.num_words = bitwise_chromosome.num_words(bits_per_project, self.num_projects)
+        self.max_allocation = (1 << bits_per_project) - 1
+
+    def decode(self, population):
+        """(pop_size, num_words) uint64 -> (pop_size, num_projects) allocations."""
+        return bitwise_chromosome.decode_field_words(population, self.bits_per_project, self.num_projects)
+
+    def encode(self, allocations):
+        return bitwise_chromosome.encode_field_words(allocations, self.bits_per_project)
+
+    def usage(self, allocations):
+        """(pop_size, num_resources) resource usage of each portfolio."""
+        return allocations @ self.costs.T
+
+    def feasible(self, usage):
+        return (usage <= self.limits).all(axis=1)
+
+    def score(self, allocations, usage):
+        """Total value; 0 for portfolios that exceed any limit."""
+        return np.where(self.feasible(usage), allocations @ self.project_values, 0.0)
+
+    def evaluate(self, population):
+        """Fitness of every chromosome; 0 when a resource limit is exceeded.
+
+        Returns (fitness, allocations).
+        """
+        allocations = self.decode(population)
+        return self.score(allocations, self.usage(allocations)), allocations
+
+    def scale_factors(self, usage):
+        """Largest factor <= 1 that brings each portfolio within every limit."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(usage > 0, self.limits / usage, np.inf)
+        return np.minimum(ratios.min(axis=1), 1.0)
+
+    def repair(self, allocations, usage):
+        """Proportional scale-down of the infeasible portfolios.
+
+        Every allocation of an over-limit portfolio is multiplied by the
+        tightest limit/usage ratio and floored; with non-negative costs the
+        result is always feasible. Works in place and returns the indices of
+        the repaired rows.
+        """
+        rows = np.flatnonzero(~self.feasible(usage))
+        if len(rows):
+            scale = self.scale_factors(usage[rows])
+            allocations[rows] = np.floor(allocations[rows] * scale[:, None]).astype(allocations.dtype)
+            usage[rows] = self.usage(allocations[rows])
+        return rows
+
+    def random_population(self, rng, pop_size):
+        # Uniform allocations, each chromosome shrunk by a random factor so the
+        # start covers feasible portfolios even when the limits are tight
+        allocations = rng.integers(0, self.max_allocation + 1, (pop_size, self.num_projects))
+        scale = rng.random(pop_size) * self.scale_factors(self.usage(allocations))
+        return self.encode(np.floor(allocations * scale[:, None]).astype(np.int64))
+
+    def from_strings(self, population):
+        """Binary strings in the genetic_algorithm_application_resource layout -> words."""
+        bits = self.bits_per_project
+        allocations = [[int(chrom[i * bits:(i + 1) * bits], 2) for i in range(self.num_projects)]
+                       for chrom in population]
+        return self.encode(allocations)
+
+    def to_strings(self, population):
+        """Words -> binary strings (display only)."""
+        bits = self.bits_per_project
+        return ["".join(format(int(a), f"0{bits}b") for a in row) for row in self.decode(population)]
+
+
+class ResourceAllocationGA:
+    def __init__(self, problem, pop_size=200, crossover_rate=0.9, mutation_rate=None,
+                 elitism=2, selector="tournament", tournament_size=2, repair=True, seed=None,
+                 population=None, fitness=None):
+        """
+        Args:
+            problem: ResourceAllocationProblem.
+            mutation_rate: Per-bit flip probability, default 1 / chromosome length.
+            elitism: Number of best chromosomes copied unchanged each generation.
+            selector: "tournament", "roulette", "sus" or a callable from
+                      selection_operators.
+            repair: Scale infeasible offspring back within the limits instead of
+                    scoring them 0.
+            population: Optional starting (pop_size, num_words) population,
+                        e.g. an island; random otherwise.
+            fitness: Scores of `population` as left by a previous engine
+                     (already repaired); skips re-scoring it.
+        """
+        if population is not None:
+            pop_size = len(population)
+        self.problem = problem
+        self.pop_size = pop_size
+        self.crossover_rate = crossover_rate
+        total_bits = problem.num_projects * problem.bits_per_project
+        self.mutation_rate = 1.0 / total_bits if mutation_rate is None else mutation_rate
+        self.elitism = elitism
+        self.selector = selection_operators.get_selector(selector)
+        self.tournament_size = tournament_size
+        self.repair = repair
+        self.rng = make_rng(seed)
+        if population is None:
+            population = problem.random_population(self.rng, pop_size)
+        self.population = np.array(population, dtype=np.uint64)
+        self.allocations = problem.decode(self.population)
+        self.usage = problem.usage(self.allocations)
+        if fitness is not None:
+            self.fitness = np.array(fitness, dtype=np.float64)
+            self.evaluations = 0
+            return
+        self._finish(self.population, self.allocations, self.usage)
+        self.fitness = problem.score(self.allocations, self.usage)
+        self.evaluations = pop_size
+
+    def selection(self, count):
+        if self.selector is selection_operators.tournament:
+            return self.selector(self.fitness, count, self.rng, k=self.tournament_size)
+        return self.selector(self.fitness, count, self.rng)
+
+    def crossover(self, parents1, parents2):
+        # Uniform crossover on whole words: take each bit from parent2 where the mask is set
+        masks = self.rng.integers(0, np.iinfo(np.uint64).max, parents1.shape,
+                                  dtype=np.uint64, endpoint=True)
+        skip = self.rng.random(len(parents1)) >= self.crossover_rate
+        masks[skip] = 0
+        return parents1 ^ ((parents1 ^ parents2) & masks)
+
+    def mutate(self, population, allocations, usage):
+        """Flip random bits in place, keeping allocations and usage in sync.
+
+        Only the mutated (chromosome, project) fields are re-costed:
+        usage += (new - old) * costs[:, project]. With fractional costs the
+        mutated chromosomes' usage is recomputed instead (no rounding drift).
+        """
+        # Draw only the flipped bits: binomial count, then uniform positions
+        count = len(population)
+        bits = self.problem.bits_per_project
+        bits_per_chrom = self.problem.num_projects * bits
+        flips = self.rng.binomial(count * bits_per_chrom, self.mutation_rate)
+        if not flips:
+            return
+        positions = self.rng.integers(0, count * bits_per_chrom, flips)
+        rows, offset = np.divmod(positions, bits_per_chrom)
+        fields, bit = np.divmod(offset, bits)
+        words, masks = bitwise_chromosome.field_bit_location(fields, bit, bits)
+        np.bitwise_xor.at(population, (rows, words), masks)
+
+        # Changed fields (a field may be hit more than once)
+        changed = np.unique(rows * self.problem.num_projects + fields)
+        rows_c, fields_c = np.divmod(changed, self.problem.num_projects)
+        old = allocations[rows_c, fields_c]
+        np.bitwise_xor.at(allocations, (rows, fields), np.left_shift(1, bits - 1 - bit))
+        if not self.problem.integer_costs:
+            mutated = np.unique(rows_c)
+            usage[mutated] = self.problem.usage(allocations[mutated])
+            return
+        delta = allocations[rows_c, fields_c] - old
+        np.add.at(usage, rows_c, delta[:, None] * self.problem.costs[:, fields_c].T)
+
+    def _finish(self, population, allocations, usage):
+        # Repair infeasible portfolios and write the repaired fields back
+        if self.repair:
+            rows = self.problem.repair(allocations, usage)
+            if len(rows):
+                population[rows] = self.problem.encode(allocations[rows])
+
+    def step(self):
+        n_children = self.pop_size - self.elitism
+        elite = np.argpartition(-self.fitness, self.elitism - 1)[:self.elitism] if self.elitism else []
+
+        parents1 = self.population[self.selection(n_children)]
+        parents2 = self.population[self.selection(n_children)]
+        children = self.crossover(parents1, parents2)
+        allocations = self.problem.decode(children)
+        usage = self.problem.usage(allocations)
+        self.mutate(children, allocations, usage)
+        self._finish(children, allocations, usage)
+
+        # Elites keep their cached allocations, usage and fitness
+        self.population = np.concatenate([self.population[elite], children])
+        self.allocations = np.concatenate([self.allocations[elite], allocations])
+        self.usage = np.concatenate([self.usage[elite], usage])
+        self.fitness = np.concatenate([self.fitness[elite], self.problem.score(allocations, usage)])
+        self.evaluations += n_children
+
+    def run(self, generations=100, report_every=None, checkpoint=None, resume_from=None):
+        """Returns (best_allocations, best_value, best_value_history).
+
+        checkpoint / resume_from: see bio_inspired.checkpoint; resume on an
+        engine built with the same arguments.
+        """
+        checkpointer = make_checkpointer(checkpoint)
+        if resume_from is None:
+            best_index = int(np.argmax(self.fitness))
+            best_value = float(self.fitness[best_index])
+            best_allocations = self.allocations[best_index].copy()
+            history = [best_value]
+            start = 1
+        else:
+            state = load_checkpoint(resume_from, "resource_ga")
+            self.population, self.allocations = state["population"], state["allocations"]
+            self.usage, self.fitness = state["usage"], state["fitness"]
+            self.evaluations = state["evaluations"]
+            best_allocations, best_value = state["best_allocations"], state["best_value"]
+            history = state["history"]
+            start = state["generation"] + 1
+            set_rng_state(self.rng, state["rng"])
+
+        for gen in range(start, generations + 1):
+            self.step()
+            best_index = int(np.argmax(self.fitness))
+            if self.fitness[best_index] > best_value:
+                best_value = float(self.fitness[best_index])
+                best_allocations = self.allocations[best_index].copy()
+            history.append(best_value)
+            if report_every is not None and gen % report_every == 0:
+                print(f"Generation {gen}: Best Value = {best_value:.2f}, "
+                      f"Avg Fitness = {self.fitness.mean():.2f}")
+
+            # step() replaces these arrays every generation, so no copies are needed
+            checkpointer.maybe_save(gen, lambda: {
+                "algorithm": "resource_ga",
+                "generation": gen,
+                "population": self.population,
+                "allocations": self.allocations,
+                "usage": self.usage,
+                "fitness": self.fitness,
+                "evaluations": self.evaluations,
+                "best_allocations": best_allocations,
+                "best_value": best_value,
+                "history": history,
+                "rng": rng_state(self.rng),
+            })
+
+        checkpointer.close()
+        return best_allocations, best_value, history
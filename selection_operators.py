@@ -0,0 +1,102 @@
+"""
+Fitness-proportionate and tournament selection for the GA modules.
+
+selection() in genetic_algorithm.py and genetic_algorithm_application_resource.py
+only prints the roulette probabilities and expected counts; these operators
+actually resample the population. Each one draws a whole mating pool in one
+batched call and returns the selected indices:
+
+    indices = roulette(fitness_values, len(population), rng)
+    population = population[indices]
+
+All operators maximize fitness. rng is a numpy.random.Generator.
+"""
+import numpy as np
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(n) build, O(1) per draw."""
+
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        n = len(weights)
+        if n == 0:
+            raise ValueError("Cannot build an alias table from no weights.")
+        if (weights < 0).any():
+            raise ValueError("Roulette selection needs non-negative fitness values.")
+        total = weights.sum()
+        if total <= 0:
+            weights = np.ones(n)  # all-zero fitness: uniform selection
+            total = float(n)
+
+        # Plain lists: element access on them is much cheaper than on arrays
+        scaled = (weights * (n / total)).tolist()
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Leftovers are 1 up to rounding error; prob stays 1 for them
+        self.prob = np.array(prob)
+        self.alias = np.array(alias)
+
+    def sample(self, rng, count):
+        columns = rng.integers(0, len(self.prob), count)
+        keep = rng.random(count) < self.prob[columns]
+        return np.where(keep, columns, self.alias[columns])
+
+
+def roulette(fitness, count, rng):
+    """Fitness-proportionate (roulette wheel) selection via an alias table."""
+    return AliasTable(fitness).sample(rng, count)
+
+
+def stochastic_universal_sampling(fitness, count, rng):
+    """SUS: count equally spaced pointers on the roulette wheel, one random offset.
+
+    Each individual is selected floor or ceil of its expected count times.
+    """
+    fitness = np.asarray(fitness, dtype=np.float64)
+    if (fitness < 0).any():
+        raise ValueError("Stochastic universal sampling needs non-negative fitness values.")
+    cumulative = np.cumsum(fitness)
+    total = cumulative[-1]
+    if total <= 0:
+        cumulative = np.arange(1, len(fitness) + 1, dtype=np.float64)
+        total = cumulative[-1]
+    step = total / count
+    pointers = rng.random() * step + step * np.arange(count)
+    indices = np.searchsorted(cumulative, pointers, side="right")
+    # SUS returns individuals in wheel order; shuffle so pairing is random
+    return rng.permutation(np.minimum(indices, len(fitness) - 1))
+
+
+def tournament(fitness, count, rng, k=2):
+    """count independent k-tournaments (with replacement), all drawn at once."""
+    fitness = np.asarray(fitness)
+    contestants = rng.integers(0, len(fitness), (count, k))
+    winners = np.argmax(fitness[contestants], axis=1)
+    return contestants[np.arange(count), winners]
+
+
+SELECTORS = {
+    "roulette": roulette,
+    "sus": stochastic_universal_sampling,
+    "tournament": tournament,
+}
+
+
+def get_selector(selector):
+    """Look up a selection operator by name; callables are returned unchanged."""
+    if callable(selector):
+        return selector
+    try:
+        return SELECTORS[selector]
+    except KeyError:
+        raise ValueError(f"Unknown selection operator {selector!r}; "
+                         f"choose from {sorted(SELECTORS)}") from None